@@ -22,7 +22,6 @@ Aligns green and blue channels to the red channel using ORB feature matching and
 
 from typing import List, Tuple
 
-import cv2  # type: ignore
 import numpy as np
 
 
@@ -53,6 +52,9 @@ def align_images(
     Cross-references:
         - handlers.channels.load_channel
     """
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # type: ignore  # pylint: disable=import-outside-toplevel
+
     # Start with copies of the originals
     aligned_grayscale = [img.copy() for img in grayscale_images]
 
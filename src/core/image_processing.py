@@ -20,14 +20,78 @@ Image processing utilities for channel adjustment, combination, and conversion f
 Includes brightness/contrast adjustment, channel combination, and conversion to QImage.
 """
 
-from typing import List, Union
+import sys
+from functools import lru_cache
+from typing import List, Sequence, Union
 
 import numpy as np
 from PyQt5.QtGui import QImage
 
+# Byte offsets of the red, green and blue components in a QImage.Format_RGB32 pixel, which is stored as
+# the native-endian 32-bit value 0xffRRGGBB
+RGB32_CHANNELS = (2, 1, 0) if sys.byteorder == "little" else (1, 2, 3)
+
+
+@lru_cache(maxsize=32)
+def _adjustment_lut(brightness: int, contrast: int) -> np.ndarray:
+    """
+    Builds the 256-entry lookup table mapping 8-bit values through a brightness/contrast adjustment.
+
+    Args:
+        brightness (int): [-100, 100] - additive brightness adjustment.
+        contrast (int): [-100, 100] - multiplicative contrast adjustment (percentage).
+
+    Returns:
+        numpy.ndarray: Read-only uint8 table of shape (256,).
+    """
+    values = np.arange(256, dtype=np.float32) * (1 + contrast / 100) + brightness
+    lut: np.ndarray = np.clip(values, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False  # Shared between calls through the cache
+    return lut
+
+
+@lru_cache(maxsize=64)
+def _channel_intensity_lut(intensity: int) -> np.ndarray:
+    """
+    Builds the 256-entry lookup table mapping 8-bit values through one channel's intensity multiplier.
+
+    Args:
+        intensity (int): Intensity multiplier in percent (0-200%).
+
+    Returns:
+        numpy.ndarray: Read-only uint8 table of shape (256,).
+    """
+    values = np.arange(256, dtype=np.float32) * np.float32(intensity / 100)
+    lut: np.ndarray = np.clip(values, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False  # Shared between calls through the cache
+    return lut
+
+
+def _scaled_planes(planes: Sequence[np.ndarray], intensities: Sequence[int]) -> List[np.ndarray]:
+    """
+    Maps each channel through its intensity multiplier, leaving channels at 100% as they are.
+
+    Scaling the separate planes before interleaving them uses OpenCV's fast single-channel table lookup
+    (a multi-channel lookup over the interleaved image is several times slower).
+
+    Args:
+        planes (list of numpy.ndarray): 8-bit grayscale channels (uint8, shape: HxW).
+        intensities (list of int): Intensity multiplier of each channel, in percent (0-200%).
+
+    Returns:
+        list of numpy.ndarray: The scaled channels.
+    """
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
+
+    return [
+        plane if intensity == 100 else cv2.LUT(plane, _channel_intensity_lut(intensity))  # pylint: disable=E1101
+        for plane, intensity in zip(planes, intensities)
+    ]
+
 
 def apply_adjustments(
-    image: Union[np.ndarray, None], brightness: int = 0, contrast: int = 0
+    image: Union[np.ndarray, None], brightness: int = 0, contrast: int = 0, out: Union[np.ndarray, None] = None
 ) -> Union[np.ndarray, None]:
     """
     Applies brightness and contrast adjustments to a grayscale image.
@@ -36,9 +100,11 @@ def apply_adjustments(
         image (numpy.ndarray or None): Input 8-bit grayscale image (shape: HxW).
         brightness (int): [-100, 100] - additive brightness adjustment.
         contrast (int): [-100, 100] - multiplicative contrast adjustment (percentage).
+        out (numpy.ndarray or None): Optional contiguous uint8 buffer (shape: HxW) that receives the
+            result instead of a newly allocated array.
 
     Returns:
-        numpy.ndarray: Adjusted 8-bit image (uint8) or None if input is invalid.
+        numpy.ndarray: Adjusted 8-bit image (uint8, out when given) or None if input is invalid.
 
     Example:
         >>> adjusted = apply_adjustments(img, brightness=20, contrast=10)
@@ -49,40 +115,115 @@ def apply_adjustments(
     if image is None:
         return None
 
+    if image.dtype == np.uint8:
+        # OpenCV is imported lazily so it does not weigh on application startup
+        import cv2  # pylint: disable=import-outside-toplevel
+
+        # Only 256 distinct inputs exist, so map every pixel through a precomputed table in a single
+        # native pass (OpenCV's LUT is parallelised and releases the GIL for the worker thread)
+        adjusted: np.ndarray = cv2.LUT(image, _adjustment_lut(brightness, contrast), dst=out)  # pylint: disable=E1101
+        return adjusted
+
     img = image.astype(np.float32)
     img = img * (1 + contrast / 100) + brightness
+    if out is not None:
+        np.clip(img, 0, 255, out=img)
+        np.copyto(out, img, casting="unsafe")
+        return out
     return np.clip(img, 0, 255).astype(np.uint8)
 
 
-def combine_channels(channels: List[Union[np.ndarray, None]], intensities: List[int]) -> Union[np.ndarray, None]:
+def combine_channels(
+    channels: Union[Sequence[Union[np.ndarray, None]], np.ndarray],
+    intensities: List[int],
+    out: Union[np.ndarray, None] = None,
+) -> Union[np.ndarray, None]:
     """
     Combines three grayscale channels into RGB image with intensity adjustments.
 
     Args:
-        channels (list of numpy.ndarray): [R, G, B] 8-bit grayscale images (uint8, shape: HxW).
+        channels (list of numpy.ndarray | numpy.ndarray): [R, G, B] 8-bit grayscale images
+                    (uint8, shape: HxW), or the same channels as one stack (uint8, shape: 3xHxW).
         intensities (list of int): [R%, G%, B%] intensity multipliers (0-200%).
+        out (numpy.ndarray | None): Optional preallocated uint8 HxWx3 array receiving the result.
 
     Returns:
-        numpy.ndarray | None: Combined 8-bit RGB image (uint8, shape: HxWx3)
+        numpy.ndarray | None: Combined 8-bit RGB image (uint8, shape: HxWx3), which is out when given,
                     or None if any channel missing
 
     Cross-references:
         - handlers.display.show_combined_image
     """
-    if any(channel is None for channel in channels):
-        return None
+    if isinstance(channels, np.ndarray):
+        planes = list(channels)
+    else:
+        if any(channel is None for channel in channels):
+            return None
+        # Create a new variable with a definite non-None type
+        planes = [c for c in channels if c is not None]
 
-    # Assert to help type checker understand all channels are now definitely not None
-    assert all(channel is not None for channel in channels)
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
+
+    # Stay in 8 bits throughout: scale each channel through a 256-entry table (which saturates exactly like
+    # clipping a float product), then interleave the planes into HxWx3 order
+    combined = np.empty((*planes[0].shape, 3), dtype=np.uint8) if out is None else out
+    cv2.merge(_scaled_planes(planes, intensities), dst=combined)  # pylint: disable=E1101
+    return combined
+
+
+def combine_channels_rgb32(channels: Sequence[np.ndarray], intensities: List[int], out: np.ndarray) -> np.ndarray:
+    """
+    Combines three grayscale channels into a 32-bit RGB display image with intensity adjustments.
 
-    # Create a new variable with a definite non-None type
-    valid_channels: List[np.ndarray] = [c for c in channels if c is not None]
+    The result uses the QImage.Format_RGB32 layout (see RGB32_CHANNELS), which Qt turns into a pixmap
+    without converting it; the unused byte of each pixel in out is left untouched and must be 0xff.
 
-    combined = np.zeros((*valid_channels[0].shape, 3), dtype=np.float32)
-    for i in range(3):
-        combined[:, :, i] = valid_channels[i].astype(np.float32) * (intensities[i] / 100)
+    Args:
+        channels (list of numpy.ndarray): [R, G, B] 8-bit grayscale images (uint8, shape: HxW).
+        intensities (list of int): [R%, G%, B%] intensity multipliers (0-200%).
+        out (numpy.ndarray): Preallocated uint8 HxWx4 array receiving the result.
+
+    Returns:
+        numpy.ndarray: out, holding the combined image.
+
+    Cross-references:
+        - handlers.display.show_combined_image
+    """
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
+
+    # Scale the planes, then scatter them into their bytes of each pixel, leaving the unused byte as is
+    cv2.mixChannels(  # pylint: disable=E1101
+        _scaled_planes(channels, intensities), [out], [index for pair in enumerate(RGB32_CHANNELS) for index in pair]
+    )
+    return out
+
+
+def update_combined_channel(combined: np.ndarray, channel: np.ndarray, plane: int, intensity: int) -> np.ndarray:
+    """
+    Rewrites one channel of an interleaved combined image in place, with the same intensity mapping as
+    combine_channels.
+
+    Args:
+        combined (numpy.ndarray): Combined 8-bit image (uint8, shape: HxWxN) to update.
+        channel (numpy.ndarray): 8-bit grayscale channel (uint8, shape: HxW).
+        plane (int): Index of the interleaved plane receiving the channel.
+        intensity (int): Intensity multiplier of the channel (0-200%).
+
+    Returns:
+        numpy.ndarray: combined, with the channel rewritten.
+
+    Cross-references:
+        - handlers.display.show_combined_image
+    """
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
 
-    return np.clip(combined, 0, 255).astype(np.uint8)
+    if intensity != 100:
+        channel = cv2.LUT(channel, _channel_intensity_lut(intensity))  # pylint: disable=E1101
+    cv2.mixChannels([channel], [combined], [0, plane])  # pylint: disable=E1101
+    return combined
 
 
 def convert_to_qimage(image: Union[np.ndarray, None]) -> QImage:
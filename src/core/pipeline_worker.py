@@ -0,0 +1,129 @@
+# Copyright (C) 2025 fozga
+#
+# This file is part of Prokudin.
+#
+# Prokudin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prokudin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Prokudin.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Background worker that runs per-channel brightness/contrast adjustments off the GUI thread.
+Only the latest request per channel is kept, so stale slider positions are never computed.
+"""
+
+import threading
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from .image_processing import apply_adjustments
+
+# Number of recycled result buffers kept for reuse
+MAX_FREE_BUFFERS = 2
+
+
+class PipelineWorker(QObject):  # pylint: disable=too-few-public-methods
+    """
+    Computes channel adjustments in a worker thread.
+
+    The worker is moved to a QThread by its owner. Requests are posted from the GUI thread with
+    request_update(); each channel keeps only its most recent pending request, and every finished
+    adjustment is delivered back to the GUI thread through result_ready.
+
+    Signals:
+        result_ready(int, object, int, int, object): Emitted with the channel index, the source image,
+            the brightness and contrast used, and the adjusted image.
+    """
+
+    result_ready = pyqtSignal(int, object, int, int, object)
+
+    # Internal signal waking the worker thread up; queued since the worker lives in another thread
+    _wake = pyqtSignal()
+
+    def __init__(self) -> None:
+        """
+        Initialize the worker with no pending requests.
+        """
+        super().__init__()
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Tuple[np.ndarray, int, int]] = {}
+        # Result buffers handed back by the owner once nothing references them, reused as outputs
+        self._free_buffers: List[np.ndarray] = []
+        self._wake.connect(self._process_pending)
+
+    def request_update(self, channel_idx: int, source: np.ndarray, brightness: int, contrast: int) -> None:
+        """
+        Schedule an adjustment of a channel, replacing any request for it that has not started yet.
+
+        Args:
+            channel_idx (int): Index of the channel to adjust (0=R, 1=G, 2=B).
+            source (np.ndarray): Aligned grayscale image of the channel.
+            brightness (int): Brightness adjustment to apply.
+            contrast (int): Contrast adjustment to apply.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            idle = not self._pending
+            self._pending[channel_idx] = (source, brightness, contrast)
+        # A non-empty queue means a wake-up is already on its way
+        if idle:
+            self._wake.emit()
+
+    def recycle(self, buffer: np.ndarray) -> None:
+        """
+        Hand back a result that is no longer referenced, so a later adjustment can write into it
+        instead of allocating (and first touching) a new full-resolution array.
+
+        Args:
+            buffer (np.ndarray): A result previously emitted through result_ready.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if len(self._free_buffers) < MAX_FREE_BUFFERS:
+                self._free_buffers.append(buffer)
+
+    def _take_buffer(self, source: np.ndarray) -> Union[np.ndarray, None]:
+        """
+        Take a recycled buffer matching the source's shape and type, if any.
+
+        Args:
+            source (np.ndarray): Image about to be adjusted.
+
+        Returns:
+            np.ndarray | None: A buffer to write the result into, or None to allocate one.
+        """
+        with self._lock:
+            for i, buffer in enumerate(self._free_buffers):
+                if buffer.shape == source.shape and buffer.dtype == np.uint8:
+                    return self._free_buffers.pop(i)
+        return None
+
+    @pyqtSlot()
+    def _process_pending(self) -> None:
+        """
+        Run the pending adjustments in the worker thread until none are left.
+
+        Returns:
+            None
+        """
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                channel_idx, (source, brightness, contrast) = self._pending.popitem()
+            result = apply_adjustments(source, brightness, contrast, out=self._take_buffer(source))
+            self.result_ready.emit(channel_idx, source, brightness, contrast, result)
@@ -23,75 +23,133 @@ Provides functions to load raw images, apply adjustments, update previews, and m
 from __future__ import annotations
 
 # Standard library imports
-from typing import TYPE_CHECKING, List, Optional, cast
+from typing import TYPE_CHECKING, List, Optional, Union, cast
 
 # Third-party imports
-import cv2
 import numpy as np
+from PyQt5.QtCore import QRect
 
 # Conditional imports for type checking
 if TYPE_CHECKING:
     from ..main_window import MainWindow
 
 # Local application imports
-from ..core.align import align_images
 from ..core.image_processing import apply_adjustments
-from .display import update_main_display
-from .image_loading import load_raw_image
+from .display import (
+    DRAFT_STRIDES,
+    build_draft_pyramid,
+    choose_draft_stride,
+    get_draft_buffer,
+    show_draft_image,
+    update_main_display,
+)
+from .image_loading import select_raw_file
+
+# Channel names for status messages
+CHANNEL_NAMES = ("Red", "Green", "Blue")
+# Status message shown when a single channel is viewed, built once per channel
+CHANNEL_VIEW_MESSAGES = tuple(f"Viewing {name} channel" for name in CHANNEL_NAMES)
+
+# Number of recent channel adjustment results kept for reuse (full-resolution arrays)
+ADJUST_RESULTS_CACHE_SIZE = 8
+
+
+def load_channel(main_window: "MainWindow", channel_idx: int) -> None:
+    """
+    Asks for a raw image file for the specified color channel and starts decoding it in the background.
+
+    The result is handled by finish_channel_load once the file has been decoded.
 
+    Args:
+        main_window (MainWindow): Reference to the main application window containing image state and UI.
+        channel_idx (int): Index of the channel to load (0=R, 1=G, 2=B).
 
-def load_channel(main_window: "MainWindow", channel_idx: int) -> None:  # pylint: disable=too-many-locals
+    Returns:
+        None
+
+    Cross-references:
+        - select_raw_file
+        - RawImageLoader.load
+        - finish_channel_load
     """
-    Loads a raw image file for the specified color channel, updates the application's state,
-    and triggers alignment and preview updates.
+    filename = select_raw_file(main_window)
+    if not filename:
+        main_window.status_handler.set_message("No file selected", main_window.status_handler.LONG_TIMEOUT)
+        return
+
+    # Only the latest file requested for a channel is applied when loads overlap
+    main_window.pending_loads[channel_idx] = filename
+    main_window.status_handler.set_message(f"Loading image into {CHANNEL_NAMES[channel_idx]} channel...")
+    main_window.raw_loader.load(channel_idx, filename)
+
+
+def finish_channel_load(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    main_window: "MainWindow",
+    channel_idx: int,
+    filename: str,
+    rgb_image: Optional[np.ndarray],
+    gray_image: Optional[np.ndarray],
+    err_msg: Optional[str],
+) -> None:
+    """
+    Stores a decoded raw image in the specified color channel, updates the application's state,
+    and triggers preview updates and, once every channel is loaded, their alignment.
 
     Args:
         main_window (MainWindow): Reference to the main application window containing image state and UI.
-        channel_idx (int): Index of the channel to load (0=R, 1=G, 2=B).
+        channel_idx (int): Index of the loaded channel (0=R, 1=G, 2=B).
+        filename (str): Path of the loaded file.
+        rgb_image (numpy.ndarray or None): Decoded RGB image, or None if loading failed.
+        gray_image (numpy.ndarray or None): Grayscale conversion of the RGB image, or None if loading failed.
+        err_msg (str or None): Error message if loading failed.
 
     Returns:
         None
 
     Cross-references:
-        - load_raw_image
-        - align_images
-        - adjust_channel
+        - RawImageLoader.loaded
+        - ImageAligner.align
         - update_channel_preview
         - update_main_display
     """
-    # Channel names for status messages
-    channel_names = {0: "Red", 1: "Green", 2: "Blue"}
-    channel_name = channel_names.get(channel_idx, "Unknown")
-
-    # Load the RGB image
-    rgb_image, err_msg = load_raw_image(main_window)
+    # Drop results superseded by a newer load of the channel or by a reset
+    if main_window.pending_loads[channel_idx] != filename:
+        return
+    main_window.pending_loads[channel_idx] = None
 
-    if rgb_image is not None:
+    if rgb_image is not None and gray_image is not None:
         # Create a new list to avoid assignment issues
         original_rgb_images: List[Optional[np.ndarray]] = list(main_window.original_rgb_images)
         original_rgb_images[channel_idx] = rgb_image
         main_window.original_rgb_images = original_rgb_images  # type: ignore
 
-        # Convert RGB to grayscale
-        image = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2GRAY)  # pylint: disable=E1101
+        image = gray_image
 
         # Create new lists with proper type annotations to avoid assignment issues
         original_images: List[Optional[np.ndarray]] = list(main_window.original_images)
         processed: List[Optional[np.ndarray]] = list(main_window.processed)
 
+        # Until the channels are aligned, the processed channel is only ever replaced, never written in
+        # place, so it shares the original image instead of copying it
         original_images[channel_idx] = image
-        processed[channel_idx] = image.copy()
+        processed[channel_idx] = image
 
-        # Assign back to main_window
+        # Assign back to main_window; the processed stack no longer matches until channels are realigned
         main_window.original_images = original_images  # type: ignore
         main_window.processed = processed  # type: ignore
+        main_window.processed_mask |= 1 << channel_idx
+        main_window.processed_stack = None
+        if main_window.canvas_shape is None:
+            main_window.canvas_shape = (image.shape[0], image.shape[1])
 
         # Display status message showing which channel was loaded
         main_window.status_handler.set_message(
-            f"Successfully loaded image into {channel_name} channel", main_window.status_handler.MEDIUM_TIMEOUT
+            f"Successfully loaded image into {CHANNEL_NAMES[channel_idx]} channel",
+            main_window.status_handler.MEDIUM_TIMEOUT,
         )
 
-        if all(img is not None for img in main_window.original_images):
+        update_channel_preview(main_window, channel_idx)
+        if main_window.processed_mask == 0b111:  # Every channel is loaded
             # Create arrays of ndarray images only, with explicit type casting for mypy
             gray_images: List[np.ndarray] = []
             rgb_images: List[np.ndarray] = []
@@ -104,33 +162,11 @@ def load_channel(main_window: "MainWindow", channel_idx: int) -> None:  # pylint
                     gray_images.append(gray_img)
                     rgb_images.append(rgb_img)
 
-            # Ensure we have exactly 3 images for each channel
+            # Ensure we have exactly 3 images for each channel, then align them in the background; the
+            # channels are shown unaligned until finish_channel_alignment takes over
             if len(gray_images) == 3 and len(rgb_images) == 3:
-                # Align both grayscale and RGB images
                 main_window.status_handler.set_message("Aligning images, please wait...")
-                aligned_gray, aligned_rgb = align_images(gray_images, rgb_images)
-
-                # Store aligned grayscale images
-                main_window.aligned = aligned_gray  # type: ignore
-
-                # Store aligned RGB images
-                main_window.aligned_rgb = aligned_rgb  # type: ignore
-
-                # Create new list with copies of aligned images
-                new_processed: List[Optional[np.ndarray]] = []
-                for img in aligned_gray:
-                    new_processed.append(img.copy())
-
-                main_window.processed = new_processed  # type: ignore
-
-                for i in range(3):
-                    adjust_channel(main_window, i)
-                    update_channel_preview(main_window, i)
-                main_window.status_handler.set_message(
-                    "All channels loaded successfully - Ready for editing!", main_window.status_handler.NO_TIMEOUT
-                )
-        else:
-            update_channel_preview(main_window, channel_idx)
+                main_window.image_aligner.align(gray_images, rgb_images)
         update_main_display(main_window)
 
         # After successfully loading a channel, update save button state
@@ -142,36 +178,266 @@ def load_channel(main_window: "MainWindow", channel_idx: int) -> None:  # pylint
         main_window.status_handler.set_message(err_msg, main_window.status_handler.LONG_TIMEOUT)
 
 
-def adjust_channel(main_window: "MainWindow", channel_idx: int) -> None:
+def finish_channel_alignment(
+    main_window: "MainWindow",
+    grayscale_images: List[np.ndarray],
+    aligned_stack: Optional[np.ndarray],
+    aligned_rgb: Optional[List[np.ndarray]],
+    err_msg: Optional[str],
+) -> None:
     """
-    Applies brightness and contrast adjustments to the specified channel and updates its preview.
+    Stores the aligned channels, applies the current adjustments to them and refreshes the previews and
+    the main display.
 
     Args:
-        main_window ("MainWindow"): Reference to the main application window.
-        channel_idx (int): Index of the channel to adjust (0=R, 1=G, 2=B).
+        main_window (MainWindow): Reference to the main application window containing image state and UI.
+        grayscale_images (list of numpy.ndarray): Grayscale images the alignment was computed from.
+        aligned_stack (numpy.ndarray or None): Aligned grayscale channels (uint8, shape: 3xHxW), or None
+            if the alignment failed.
+        aligned_rgb (list of numpy.ndarray or None): Aligned RGB images, or None if the alignment failed.
+        err_msg (str or None): Error message if the alignment failed.
 
     Returns:
         None
 
     Cross-references:
+        - ImageAligner.aligned
         - apply_adjustments
-        - update_channel_preview
+        - update_channel_previews
         - update_main_display
     """
-    if main_window.aligned[channel_idx] is not None:
-        main_window.status_handler.set_message("Processing image, please wait...")
+    # Drop results for channels that were reloaded or reset while they were being aligned
+    if any(image is not current for image, current in zip(grayscale_images, main_window.original_images)):
+        return
+
+    if aligned_stack is None or aligned_rgb is None:
+        main_window.status_handler.set_message(
+            err_msg or "Failed to align images. Please try again.", main_window.status_handler.LONG_TIMEOUT
+        )
+        return
+
+    # Store aligned grayscale images as views into one contiguous (3, H, W) stack, along with their
+    # subsampled drafts; earlier results no longer apply
+    main_window.adjust_results.clear()
+    main_window.aligned_stack = aligned_stack
+    main_window.aligned = list(aligned_stack)  # type: ignore
+    main_window.aligned_pyramid = [build_draft_pyramid(img) for img in aligned_stack]
+
+    # Store aligned RGB images
+    main_window.aligned_rgb = aligned_rgb  # type: ignore
+
+    # Apply the current adjustments right away (the processed channels must be ready before the display
+    # is updated below), writing them into one contiguous (3, H, W) stack that the display composites in
+    # a single pass
+    processed_stack = np.empty_like(aligned_stack)
+    for i, img in enumerate(cast(List[np.ndarray], main_window.aligned)):
+        brightness: int = main_window.controllers[i].sliders["brightness"].value()
+        contrast: int = main_window.controllers[i].sliders["contrast"].value()
+        apply_adjustments(img, brightness, contrast, out=processed_stack[i])
+        main_window.adjust_cache[i] = (img, brightness, contrast)
+
+    main_window.processed_stack = processed_stack
+    main_window.canvas_shape = (processed_stack.shape[1], processed_stack.shape[2])
+    main_window.processed = list(processed_stack)  # type: ignore
+
+    update_channel_previews(main_window)
+    main_window.status_handler.set_message(
+        "All channels loaded successfully - Ready for editing!", main_window.status_handler.NO_TIMEOUT
+    )
+    update_main_display(main_window)
+    main_window.update_save_button_state()
+
+
+def adjust_channel(main_window: "MainWindow", channel_idx: int, draft: bool = False) -> None:
+    """
+    Requests brightness and contrast adjustments of the specified channel from the pipeline worker.
+
+    Args:
+        main_window ("MainWindow"): Reference to the main application window.
+        channel_idx (int): Index of the channel to adjust (0=R, 1=G, 2=B).
+        draft (bool): If True (while a slider is dragged), only adjust a subsampled level of the channel
+            sized to the viewer and show a low-resolution draft of the main view.
+
+    Returns:
+        None
+
+    Cross-references:
+        - PipelineWorker.request_update
+        - apply_channel_result
+        - show_draft_image
+        - MainWindow.schedule_main_display
+    """
+    source = main_window.aligned[channel_idx]
+    if source is not None:
         brightness: int = main_window.controllers[channel_idx].sliders["brightness"].value()
         contrast: int = main_window.controllers[channel_idx].sliders["contrast"].value()
-        result = apply_adjustments(main_window.aligned[channel_idx], brightness, contrast)
+
+        pyramid = main_window.aligned_pyramid[channel_idx]
+        if draft and pyramid:
+            # Use the coarsest pyramid level that still fills the viewer
+            stride = choose_draft_stride(main_window)
+            thumb = pyramid[DRAFT_STRIDES.index(stride)] if stride > 1 else source
+            adjusted = apply_adjustments(thumb, brightness, contrast, out=get_draft_buffer(main_window, 0, thumb.shape))
+            show_draft_image(main_window, channel_idx, cast(np.ndarray, adjusted), stride)
+            return
+
+        # When the processed channel already reflects these settings (e.g. only the intensity
+        # changed), skip the per-channel adjustment and just recompose the display; the slider burst
+        # was already coalesced by the adjust timer, so it is redrawn without waiting another frame
+        cached = main_window.adjust_cache[channel_idx]
+        if cached is not None and cached[0] is source and cached[1:] == (brightness, contrast):
+            main_window.flush_main_display()
+            return
+
+        # Settings visited recently (e.g. a slider moved back and forth) are restored without recomputing
+        recent = main_window.adjust_results.get((channel_idx, brightness, contrast))
+        if recent is not None and recent[0] is source:
+            apply_channel_result(main_window, channel_idx, source, brightness, contrast, recent[1])
+            return
+
+        # The adjustment runs on the pipeline worker thread; apply_channel_result installs it
+        main_window.status_handler.set_message("Processing image, please wait...")
+        main_window.pipeline_worker.request_update(channel_idx, source, brightness, contrast)
+
+
+def schedule_channel_adjustment(main_window: "MainWindow", channel_idx: int) -> None:
+    """
+    Requests an adjustment of a channel, running it at most once per frame.
+
+    The first request of a burst runs immediately; requests arriving while the channel's throttle timer
+    is active are folded into a single run with the latest values when it expires.
+
+    Args:
+        main_window (MainWindow): The instance of the main window.
+        channel_idx (int): Index of the channel to adjust (0=R, 1=G, 2=B).
+
+    Returns:
+        None
+
+    Cross-references:
+        - adjust_channel
+        - flush_channel_adjustment
+    """
+    if main_window.adjust_timers[channel_idx].isActive():
+        main_window.adjust_pending[channel_idx] = True
+        return
+    _run_channel_adjustment(main_window, channel_idx)
+
+
+def flush_channel_adjustment(main_window: "MainWindow", channel_idx: int) -> None:
+    """
+    Runs the adjustment folded while the channel's throttle timer was active, if any.
+
+    Args:
+        main_window (MainWindow): The instance of the main window.
+        channel_idx (int): Index of the channel to adjust (0=R, 1=G, 2=B).
+
+    Returns:
+        None
+    """
+    if main_window.adjust_pending[channel_idx]:
+        main_window.adjust_pending[channel_idx] = False
+        _run_channel_adjustment(main_window, channel_idx)
+
+
+def _run_channel_adjustment(main_window: "MainWindow", channel_idx: int) -> None:
+    """
+    Adjusts a channel, as a low-resolution draft while one of its sliders is held down, and restarts its
+    throttle timer.
+
+    Args:
+        main_window (MainWindow): The instance of the main window.
+        channel_idx (int): Index of the channel to adjust (0=R, 1=G, 2=B).
+
+    Returns:
+        None
+    """
+    adjust_channel(main_window, channel_idx, draft=main_window.controllers[channel_idx].is_dragging())
+    main_window.adjust_timers[channel_idx].start()
+
+
+def apply_channel_result(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    main_window: "MainWindow",
+    channel_idx: int,
+    source: np.ndarray,
+    brightness: int,
+    contrast: int,
+    result: Optional[np.ndarray],
+) -> None:
+    """
+    Installs a channel adjustment computed by the pipeline worker and updates the previews.
+
+    Results that no longer match the channel's aligned image or slider values are dropped, since a
+    newer adjustment has been requested (or the current one is already displayed).
+
+    Args:
+        main_window ("MainWindow"): Reference to the main application window.
+        channel_idx (int): Index of the adjusted channel (0=R, 1=G, 2=B).
+        source (np.ndarray): Aligned image the adjustment was computed from.
+        brightness (int): Brightness used for the adjustment.
+        contrast (int): Contrast used for the adjustment.
+        result (np.ndarray | None): Adjusted image.
+
+    Returns:
+        None
+
+    Cross-references:
+        - PipelineWorker.result_ready
+        - update_channel_preview
+        - MainWindow.schedule_main_display
+    """
+    controller = main_window.controllers[channel_idx]
+    if (
+        source is not main_window.aligned[channel_idx]
+        or brightness != controller.sliders["brightness"].value()
+        or contrast != controller.sliders["contrast"].value()
+    ):
         if result is not None:
+            _recycle_result(main_window, result)
+        return
+
+    if result is not None:
+        processed_stack = main_window.processed_stack
+        if processed_stack is not None:
+            # Update the channel's view in place so the stack stays contiguous
+            np.copyto(processed_stack[channel_idx], result)
+            main_window.processed_version += 1
+            main_window.channel_versions[channel_idx] += 1
+        else:
             # Create a new list to avoid assignment issues
             processed: List[Optional[np.ndarray]] = list(main_window.processed)
             processed[channel_idx] = result
             main_window.processed = processed  # type: ignore
+        main_window.adjust_cache[channel_idx] = (source, brightness, contrast)
+
+        # Remember the result for the most recently used settings
+        key = (channel_idx, brightness, contrast)
+        main_window.adjust_results[key] = (source, result)
+        main_window.adjust_results.move_to_end(key)
+        while len(main_window.adjust_results) > ADJUST_RESULTS_CACHE_SIZE:
+            _recycle_result(main_window, main_window.adjust_results.popitem(last=False)[1][1])
+
+        update_channel_preview(main_window, channel_idx)
+        main_window.schedule_main_display()
+    main_window.status_handler.set_message("")  # No timeout needed for clearing message
+
 
-            update_channel_preview(main_window, channel_idx)
-            update_main_display(main_window)
-        main_window.status_handler.set_message("")  # No timeout needed for clearing message
+def _recycle_result(main_window: "MainWindow", result: np.ndarray) -> None:
+    """
+    Returns an adjustment result to the pipeline worker for reuse, unless it is still in use.
+
+    Args:
+        main_window ("MainWindow"): Reference to the main application window.
+        result (np.ndarray): Result that was dropped or evicted from the recent results.
+
+    Returns:
+        None
+    """
+    in_use = any(result is img for img in main_window.processed) or any(
+        result is entry[1] for entry in main_window.adjust_results.values()
+    )
+    if not in_use:
+        main_window.pipeline_worker.recycle(result)
 
 
 def update_channel_preview(main_window: "MainWindow", channel_idx: int) -> None:
@@ -188,9 +454,56 @@ def update_channel_preview(main_window: "MainWindow", channel_idx: int) -> None:
     Cross-references:
         - ChannelController.update_preview
     """
+    _refresh_preview(main_window, channel_idx, _preview_crop(main_window))
+
+
+def update_channel_previews(main_window: "MainWindow") -> None:
+    """
+    Updates the preview images of all channel controllers, looking up the crop once for all of them.
+
+    Args:
+        main_window ("MainWindow"): Reference to the main application window.
+
+    Returns:
+        None
+
+    Cross-references:
+        - ChannelController.update_preview
+    """
+    crop_rect = _preview_crop(main_window)
+    for channel_idx in range(3):
+        _refresh_preview(main_window, channel_idx, crop_rect)
+
+
+def _preview_crop(main_window: "MainWindow") -> Union[QRect, None]:
+    """
+    Returns the crop shown by the channel previews: the saved crop, except in crop mode.
+
+    Args:
+        main_window ("MainWindow"): Reference to the main application window.
+
+    Returns:
+        QRect | None: The crop rectangle, or None for the whole image.
+    """
+    return None if main_window.crop_mode else main_window.viewer.get_saved_crop_rect()
+
+
+def _refresh_preview(main_window: "MainWindow", channel_idx: int, crop_rect: Union[QRect, None]) -> None:
+    """
+    Hands a channel's processed image to its controller and refreshes the preview.
+
+    Args:
+        main_window ("MainWindow"): Reference to the main application window.
+        channel_idx (int): Index of the channel to update (0=R, 1=G, 2=B).
+        crop_rect (QRect | None): Crop shown by the preview, or None for the whole image.
+
+    Returns:
+        None
+    """
     controller = main_window.controllers[channel_idx]
     controller.processed_image = main_window.processed[channel_idx]
-    controller.update_preview()
+    # Stack rows are updated in place, so the processed version tells the controller when pixels changed
+    controller.update_preview(main_window.processed_version, crop_rect)
 
 
 def show_single_channel(main_window: "MainWindow", channel_idx: int) -> None:
@@ -17,43 +17,236 @@
 
 """
 Display handlers for updating the main image view and channel previews in the application.
+Full-resolution views are composed on a background thread into one of two display buffers, so the
+buffer on screen is never written while it is painted.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Callable, List, Tuple, Union, cast
 
 import numpy as np
-from PyQt5.QtCore import QRectF
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import QObject, QRect, QRectF, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
 
 if TYPE_CHECKING:
     from ..main_window import MainWindow
 
-from ..core.image_processing import combine_channels, convert_to_qimage
+from ..core.image_processing import (
+    RGB32_CHANNELS,
+    combine_channels,
+    combine_channels_rgb32,
+    convert_to_qimage,
+    update_combined_channel,
+)
 
+# Subsampling steps of the draft pyramid used for low-resolution previews while a slider is dragged
+DRAFT_STRIDES = (2, 4, 8)
 
-def update_main_display(main_window: "MainWindow") -> None:
+# Number of recent combined views kept as pixmaps, enough to switch between the cropped and full views
+# (and to keep a cropped view cut from a full one alongside both display buffers)
+COMPOSITE_CACHE_SIZE = 3
+
+
+def update_main_display(main_window: "MainWindow", repaint_only: bool = False) -> None:
     """
     Updates the main display of the application based on the current state of the main window.
 
     Args:
         main_window (QMainWindow): The main window object containing the display settings and viewer.
+        repaint_only (bool): True when only the overlay (e.g. the crop rectangle) changed; the image
+            already shown is then repainted as is instead of being recomposed.
 
     Returns:
         None
     """
+    if repaint_only and main_window.viewer.photo is not None and not main_window.viewer.photo.pixmap().isNull():
+        main_window.viewer.photo.update()
+        return
+
+    # Only one frame is composed at a time; requests arriving meanwhile are merged into one recomposition
+    # once it is done
+    if main_window.display_composer.busy:
+        main_window.display_composer.stale = True
+        return
+
     if main_window.show_combined:
         show_combined_image(main_window)
     else:
         show_single_channel_image(main_window)
+    _fit_scene(main_window)
+
+
+def _fit_scene(main_window: "MainWindow") -> None:
+    """
+    Sizes the viewer's scene to the displayed pixmap.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
 
+    Returns:
+        None
+    """
     # Add null check before accessing pixmap()
     if main_window.viewer.photo is not None and main_window.viewer.photo.pixmap():
         pixmap = main_window.viewer.photo.pixmap()
         main_window.viewer.setSceneRect(QRectF(0, 0, pixmap.width(), pixmap.height()))
 
 
+@dataclass
+class DisplayFrame:  # pylint: disable=too-many-instance-attributes
+    """Store a main view being composed into one of the display buffers."""
+
+    work: Callable[[], object]
+    slot: int
+    q_img: QImage
+    contents: Union[tuple, None]
+    cache_key: Union[tuple, None]
+    processed: tuple
+    view: tuple
+    error: Union[str, None] = None
+
+
+class DisplayComposer(QObject):  # pylint: disable=too-few-public-methods
+    """
+    Composes full-resolution main views on a background thread, one frame at a time.
+
+    Signals:
+        composed(object): Emitted with the finished DisplayFrame. Connected slots run in the thread the
+            composer lives in (the GUI thread).
+    """
+
+    composed = pyqtSignal(object)
+
+    def __init__(self, parent: Union[QObject, None] = None) -> None:
+        """
+        Initialize the composer with a single-threaded pool.
+
+        Args:
+            parent (QObject | None): Parent object.
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        # A frame is being composed, and the view changed since it was started
+        self.busy = False
+        self.stale = False
+
+    def compose(self, frame: DisplayFrame) -> None:
+        """
+        Start composing a frame; composed is emitted once it is done.
+
+        Args:
+            frame (DisplayFrame): The frame to compose.
+
+        Returns:
+            None
+        """
+        self.busy = True
+        self.pool.start(_ComposeJob(self, frame))
+
+
+class _ComposeJob(QRunnable):  # pylint: disable=too-few-public-methods
+    """
+    Thread pool job composing one frame for DisplayComposer.
+    """
+
+    def __init__(self, composer: DisplayComposer, frame: DisplayFrame) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            composer (DisplayComposer): Composer whose composed signal reports the frame.
+            frame (DisplayFrame): The frame to compose.
+        """
+        super().__init__()
+        self.composer = composer
+        self.frame = frame
+
+    def run(self) -> None:
+        """
+        Write the frame's display buffer in a pool thread and report it, along with any failure.
+        """
+        try:
+            self.frame.work()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # An exception escaping run() would abort the application
+            self.frame.error = f"Error composing the image: {e}"
+        finally:
+            self.composer.composed.emit(self.frame)
+
+
+def current_view_key(main_window: "MainWindow") -> tuple:
+    """
+    Describes what the main view should currently show.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+
+    Returns:
+        tuple: (processed version, intensities, crop rectangle or None) for the combined view, which is
+        also its key in the composite cache, or ("channel", channel index, processed version, crop
+        rectangle or None) for a single channel.
+    """
+    saved_crop_rect = None if main_window.crop_mode else main_window.viewer.get_saved_crop_rect()
+    crop_key = saved_crop_rect.getRect() if saved_crop_rect is not None else None
+    if main_window.show_combined:
+        intensities = tuple(ctrl.sliders["intensity"].value() for ctrl in main_window.controllers)
+        return (main_window.processed_version, intensities, crop_key)
+    return ("channel", main_window.current_channel, main_window.processed_version, crop_key)
+
+
+def finish_display_frame(main_window: "MainWindow", frame: DisplayFrame) -> None:
+    """
+    Shows a composed frame, or recomposes when the view changed while it was being composed.
+
+    A frame that failed is reported in the status bar instead. While a slider is held down the draft on
+    screen is kept, since releasing the slider recomposes the view anyway.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        frame (DisplayFrame): The composed frame.
+
+    Returns:
+        None
+
+    Cross-references:
+        - DisplayComposer.composed
+        - update_main_display
+    """
+    composer = main_window.display_composer
+    composer.busy = False
+    entry = main_window.display_buffers[frame.slot]
+    if frame.error is not None:
+        main_window.status_handler.set_message(frame.error, main_window.status_handler.LONG_TIMEOUT)
+    elif entry is not None and entry[1] is frame.q_img:
+        main_window.display_contents[frame.slot] = frame.contents
+
+    # The view may have changed without a recomposition being requested, e.g. when a crop was applied to
+    # the image on screen, or the processed channels were replaced
+    outdated = frame.view != current_view_key(main_window) or any(
+        a is not b for a, b in zip(frame.processed, main_window.processed)
+    )
+    dragging = any(ctrl.is_dragging() for ctrl in main_window.controllers)
+    if composer.stale or frame.error is not None or outdated or dragging:
+        recompose = composer.stale or (frame.error is None and outdated)
+        composer.stale = False
+        if recompose and not dragging:
+            update_main_display(main_window)
+        return
+
+    # The pixmap shares the buffer's memory, so a cache entry also records the QImage owning it
+    pixmap = QPixmap.fromImage(frame.q_img)
+    if frame.cache_key is not None:
+        _remember_composite(main_window, frame.cache_key, (frame.processed, pixmap, frame.q_img))
+    main_window.display_shown = frame.q_img
+    main_window.display_key = frame.view
+    main_window.viewer.set_image(pixmap)
+    _fit_scene(main_window)
+
+
 def show_combined_image(main_window: "MainWindow") -> None:
     """
     Displays the combined RGB image in the main viewer.
@@ -64,42 +257,274 @@ def show_combined_image(main_window: "MainWindow") -> None:
     Returns:
         None
     """
-    if any(img is None for img in main_window.processed):
+    if main_window.processed_mask != 0b111:  # Every channel must be loaded
+        return
+
+    # Channels waiting for alignment may differ in size (e.g. a rotated shot, or one channel reloaded
+    # after the others were aligned) and cannot be combined; leave the view empty until they are aligned
+    if main_window.processed_stack is None and any(
+        img is None or img.shape[:2] != main_window.canvas_shape for img in main_window.processed
+    ):
+        if main_window.viewer.photo is not None and not main_window.viewer.photo.pixmap().isNull():
+            main_window.viewer.clear_image()
+        main_window.display_shown = None
+        main_window.display_key = None
         return
 
     # If not in crop mode and a crop rectangle is set, crop the processed images on-the-fly
     saved_crop_rect = main_window.viewer.get_saved_crop_rect()
-    if not main_window.crop_mode and saved_crop_rect is not None:
-        cropped_channels: List[np.ndarray | None] = []
-        for img in main_window.processed:
-            if img is not None:
-                cropped = img[
-                    saved_crop_rect.top() : saved_crop_rect.bottom() + 1,
-                    saved_crop_rect.left() : saved_crop_rect.right() + 1,
-                ].copy()
-                cropped_channels.append(cropped)
-            else:
-                cropped_channels.append(None)
-        intensities = [ctrl.sliders["intensity"].value() for ctrl in main_window.controllers]
-        combined = combine_channels(cropped_channels, intensities)
-        q_img = convert_to_qimage(combined)
-        main_window.viewer.set_image(QPixmap.fromImage(q_img))
+    if main_window.crop_mode:
+        saved_crop_rect = None
+    intensities = [ctrl.sliders["intensity"].value() for ctrl in main_window.controllers]
+
+    # Reuse a recent composite when neither the processed channels, intensities nor crop changed, so
+    # entering or cancelling crop mode swaps pixmaps instead of recompositing
+    key = current_view_key(main_window)
+    cached = _cached_composite(main_window, key)
+    if cached is None and saved_crop_rect is not None:
+        # A new crop of a view already composited in full is cut out of its pixmap instead
+        full = _cached_composite(main_window, (key[0], key[1], None))
+        if full is not None:
+            cached = (full[0], full[1].copy(saved_crop_rect), None)
+            _remember_composite(main_window, key, cached)
+    if cached is not None:
+        main_window.display_shown = cached[2]
+        main_window.display_key = key
+        main_window.viewer.set_image(cached[1])
         return
 
-    # Otherwise use full images
-    channels: List[np.ndarray | None] = []
-    for img in main_window.processed:
-        if img is not None:
-            channels.append(img.copy())
-        else:
-            channels.append(None)
+    channels = _cropped_channels(main_window, saved_crop_rect)
+    slot, _, q_img = _get_display_buffer(main_window, channels[0].shape)
+    work, contents = _compose_display(main_window, slot, channels, intensities, key[2])
+    processed = tuple(main_window.processed)
+    main_window.display_composer.compose(DisplayFrame(work, slot, q_img, contents, key, processed, key))
 
-    intensities = [ctrl.sliders["intensity"].value() for ctrl in main_window.controllers]
-    combined = combine_channels(channels, intensities)
 
-    if combined is not None:
-        q_img = convert_to_qimage(combined)
-        main_window.viewer.set_image(QPixmap.fromImage(q_img))
+def _cached_composite(main_window: "MainWindow", key: tuple) -> Union[tuple, None]:
+    """
+    Looks up a recent composite, marking it as the most recently used.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        key (tuple): (processed version, intensities, crop rectangle or None).
+
+    Returns:
+        tuple | None: The cache entry, or None when there is none for the current processed channels.
+    """
+    cached = main_window.composite_cache.get(key)
+    if cached is None or any(a is not b for a, b in zip(cached[0], main_window.processed)):
+        return None
+    main_window.composite_cache.move_to_end(key)
+    return cached
+
+
+def _remember_composite(main_window: "MainWindow", key: tuple, entry: tuple) -> None:
+    """
+    Adds a composite to the cache, evicting the least recently used ones beyond COMPOSITE_CACHE_SIZE.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        key (tuple): (processed version, intensities, crop rectangle or None).
+        entry (tuple): (processed images, pixmap, QImage whose memory the pixmap shares or None).
+
+    Returns:
+        None
+    """
+    main_window.composite_cache[key] = entry
+    main_window.composite_cache.move_to_end(key)
+    while len(main_window.composite_cache) > COMPOSITE_CACHE_SIZE:
+        main_window.composite_cache.popitem(last=False)
+
+
+def _cropped_channels(main_window: "MainWindow", saved_crop_rect: Union[QRect, None]) -> List[np.ndarray]:
+    """
+    Returns cropped views (no copies) of the processed channels, all of which must be loaded.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        saved_crop_rect (QRect | None): Crop rectangle to apply, or None for the full image.
+
+    Returns:
+        list of numpy.ndarray: [R, G, B] views of the processed channels.
+    """
+    processed_stack = main_window.processed_stack
+    if processed_stack is not None:
+        # All channels live in one (3, H, W) stack: crop it as a single view
+        if saved_crop_rect is not None:
+            processed_stack = processed_stack[
+                :,
+                saved_crop_rect.top() : saved_crop_rect.bottom() + 1,
+                saved_crop_rect.left() : saved_crop_rect.right() + 1,
+            ]
+        return list(processed_stack)
+
+    channels = []
+    for img in cast(List[np.ndarray], main_window.processed):
+        if saved_crop_rect is not None:
+            img = img[
+                saved_crop_rect.top() : saved_crop_rect.bottom() + 1,
+                saved_crop_rect.left() : saved_crop_rect.right() + 1,
+            ]
+        channels.append(img)
+    return channels
+
+
+def _compose_display(
+    main_window: "MainWindow",
+    slot: int,
+    channels: List[np.ndarray],
+    intensities: List[int],
+    crop_key: Union[tuple, None],
+) -> Tuple[Callable[[], object], tuple]:
+    """
+    Prepares compositing the channels into a display buffer (see _get_display_buffer).
+
+    When the buffer still holds this crop of the channels, only the planes whose processed image or
+    intensity changed (typically the one channel being adjusted) are rewritten.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        slot (int): Index of the display buffer in main_window.display_buffers.
+        channels (list of numpy.ndarray): [R, G, B] cropped processed channels.
+        intensities (list of int): [R%, G%, B%] intensity multipliers.
+        crop_key (tuple | None): Crop rectangle as (x, y, width, height), or None.
+
+    Returns:
+        tuple: (callable writing the combined image into the buffer, record of the buffer's contents
+        once it has run)
+    """
+    buffer = cast(Tuple[np.ndarray, QImage], main_window.display_buffers[slot])[0]
+    contents = tuple(zip(main_window.processed, main_window.channel_versions, intensities))
+    previous = main_window.display_contents[slot]
+    changed = [0, 1, 2]
+    if previous is not None and previous[0] == crop_key:
+        changed = [
+            i for i, (old, new) in enumerate(zip(previous[1], contents)) if old[0] is not new[0] or old[1:] != new[1:]
+        ]
+    # The buffer is about to be overwritten, so it no longer holds what was recorded
+    main_window.display_contents[slot] = None
+
+    work: Callable[[], object]
+    if len(changed) == 3:
+        work = partial(combine_channels_rgb32, channels, intensities, out=buffer)
+    else:
+        work = partial(_update_planes, buffer, [(channels[i], RGB32_CHANNELS[i], intensities[i]) for i in changed])
+    return work, (crop_key, contents)
+
+
+def _update_planes(buffer: np.ndarray, planes: List[Tuple[np.ndarray, int, int]]) -> None:
+    """
+    Rewrites some planes of a combined display buffer.
+
+    Args:
+        buffer (numpy.ndarray): Display buffer (uint8, shape: HxWx4, QImage.Format_RGB32 layout).
+        planes (list of tuple): (channel, byte offset in the buffer, intensity) of each plane to rewrite.
+
+    Returns:
+        None
+    """
+    for channel, plane, intensity in planes:
+        update_combined_channel(buffer, channel, plane, intensity)
+
+
+def build_draft_pyramid(image: np.ndarray) -> List[np.ndarray]:
+    """
+    Builds contiguous subsampled copies of an aligned channel, one per step in DRAFT_STRIDES.
+
+    Args:
+        image (numpy.ndarray): Aligned grayscale image (uint8, shape: HxW).
+
+    Returns:
+        list of numpy.ndarray: Subsampled images, finest first.
+    """
+    return [np.ascontiguousarray(image[::stride, ::stride]) for stride in DRAFT_STRIDES]
+
+
+def choose_draft_stride(main_window: "MainWindow") -> int:
+    """
+    Picks the coarsest draft subsampling step that still gives one pixel per device pixel at the
+    viewer's current zoom.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+
+    Returns:
+        int: 1 when the image is shown at or above its own resolution, else a step from DRAFT_STRIDES.
+    """
+    # Device pixels per image pixel along each axis (the view keeps the aspect ratio)
+    scale = main_window.viewer.transform().m11() * main_window.viewer.devicePixelRatioF()
+    stride = 1
+    for candidate in DRAFT_STRIDES:
+        if candidate * scale > 1:
+            break
+        stride = candidate
+    return stride
+
+
+def get_draft_buffer(main_window: "MainWindow", index: int, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Returns a scratch array for drafts, reallocated only when the draft size changes.
+
+    Drafts are copied into a pixmap as soon as they are shown, so the same arrays serve every frame of a
+    slider drag instead of allocating new ones.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        index (int): 0 for the adjusted channel level, 1 for the combined draft.
+        shape (tuple of int): Shape of the array.
+
+    Returns:
+        numpy.ndarray: Uninitialized uint8 array of the given shape.
+    """
+    buffer = main_window.draft_buffers[index]
+    if buffer is None or buffer.shape != tuple(shape):
+        buffer = np.empty(shape, dtype=np.uint8)
+        main_window.draft_buffers[index] = buffer
+    return buffer
+
+
+def show_draft_image(main_window: "MainWindow", channel_idx: int, draft: np.ndarray, stride: int) -> None:
+    """
+    Displays a quick low-resolution version of the main view while a slider is dragged.
+
+    The adjusted channel comes from its draft; the other channels are subsampled from the processed
+    stack. The result is scaled back to the displayed size so the scene geometry is unchanged.
+
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        channel_idx (int): Index of the channel being adjusted (0=R, 1=G, 2=B).
+        draft (numpy.ndarray): Adjusted channel, subsampled by stride.
+        stride (int): Subsampling step of the draft.
+
+    Returns:
+        None
+    """
+    processed_stack = main_window.processed_stack
+    if processed_stack is None:
+        return
+
+    planes: List[np.ndarray | None] = list(processed_stack[:, ::stride, ::stride])
+    planes[channel_idx] = draft
+    height, width = processed_stack.shape[1:]
+
+    # Crop on the subsampled grid, keeping only samples inside the saved crop rectangle
+    saved_crop_rect = main_window.viewer.get_saved_crop_rect()
+    if not main_window.crop_mode and saved_crop_rect is not None:
+        rows = slice(-(-saved_crop_rect.top() // stride), saved_crop_rect.bottom() // stride + 1)
+        cols = slice(-(-saved_crop_rect.left() // stride), saved_crop_rect.right() // stride + 1)
+        planes = [plane[rows, cols] if plane is not None else None for plane in planes]
+        height, width = saved_crop_rect.height(), saved_crop_rect.width()
+
+    if main_window.show_combined:
+        intensities = [ctrl.sliders["intensity"].value() for ctrl in main_window.controllers]
+        shape = cast(np.ndarray, planes[channel_idx]).shape
+        image = combine_channels(planes, intensities, out=get_draft_buffer(main_window, 1, (*shape, 3)))
+    else:
+        image = np.ascontiguousarray(planes[main_window.current_channel])
+
+    q_img = convert_to_qimage(image)
+    main_window.display_key = None
+    main_window.viewer.set_image(QPixmap.fromImage(q_img).scaled(width, height))
 
 
 def show_single_channel_image(main_window: "MainWindow") -> None:
@@ -112,6 +537,9 @@ def show_single_channel_image(main_window: "MainWindow") -> None:
     Returns:
         None
     """
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
+
     img = main_window.processed[main_window.current_channel]
     if img is not None:
         # If not in crop mode and a crop rectangle is set, crop the processed image on-the-fly
@@ -120,11 +548,53 @@ def show_single_channel_image(main_window: "MainWindow") -> None:
             img = img[
                 saved_crop_rect.top() : saved_crop_rect.bottom() + 1,
                 saved_crop_rect.left() : saved_crop_rect.right() + 1,
-            ].copy()
+            ]
+
+        # Convert to RGB (by copying the same channel into the red, green and blue bytes of the display buffer)
+        slot, buffer, q_img = _get_display_buffer(main_window, img.shape)
+        from_to = [index for offset in RGB32_CHANNELS for index in (0, offset)]
+        main_window.display_contents[slot] = None
+        work = partial(cv2.mixChannels, [img], [buffer], from_to)  # pylint: disable=E1101
+        frame = DisplayFrame(work, slot, q_img, None, None, tuple(main_window.processed), current_view_key(main_window))
+        main_window.display_composer.compose(frame)
+
 
-        # Convert to RGB (by stacking the same channel 3 times)
-        rgb_img = np.stack([img] * 3, axis=-1)
+def _get_display_buffer(main_window: "MainWindow", shape: Tuple[int, ...]) -> Tuple[int, np.ndarray, QImage]:
+    """
+    Returns the display buffer not on screen and the QImage owning its memory, reallocating both only
+    when the displayed size changes.
+
+    The buffers use the QImage.Format_RGB32 layout, so QPixmap.fromImage shares their memory instead of
+    converting it. Cached composites made from the returned buffer would therefore change along with it:
+    they are dropped, since the caller is about to overwrite it.
 
-        # Convert to QImage and display
-        q_img = convert_to_qimage(rgb_img)
-        main_window.viewer.set_image(QPixmap.fromImage(q_img))
+    Args:
+        main_window (QMainWindow): Reference to the main application window.
+        shape (tuple of int): Height and width of the image to display.
+
+    Returns:
+        tuple: (index in main_window.display_buffers, numpy.ndarray buffer of shape HxWx4 with the unused
+        bytes set to 0xff, QImage owning it)
+    """
+    # Write into the buffer that is not on screen
+    first = main_window.display_buffers[0]
+    slot = 1 if first is not None and first[1] is main_window.display_shown else 0
+    entry = main_window.display_buffers[slot]
+    if entry is None or entry[0].shape[:2] != tuple(shape[:2]):
+        height, width = shape[0], shape[1]
+        # Qt owns the pixels, so pixmaps sharing them stay valid; the buffer is a NumPy view of them,
+        # taken while the image is not shared yet (bits() would detach a shared image)
+        q_img = QImage(width, height, QImage.Format_RGB32)
+        q_img.fill(Qt.GlobalColor.black)
+        bits = q_img.bits()
+        if bits is None:
+            raise MemoryError(f"Could not allocate a {width}x{height} display image")
+        bits.setsize(q_img.sizeInBytes())
+        pixels = np.frombuffer(bits, dtype=np.uint8)  # type: ignore[call-overload]
+        entry = (pixels.reshape(height, q_img.bytesPerLine() // 4, 4)[:, :width], q_img)
+        main_window.display_buffers[slot] = entry
+        main_window.display_contents[slot] = None
+    else:
+        for key in [key for key, cached in main_window.composite_cache.items() if cached[2] is entry[1]]:
+            del main_window.composite_cache[key]
+    return slot, entry[0], entry[1]
@@ -17,38 +17,70 @@
 
 """
 Image loading utilities for selecting and processing Sony ARW RAW files.
-Provides functions to open file dialogs, load RAW images, and convert them for further processing.
+Provides functions to open file dialogs, load RAW images, and convert them for further processing,
+and a loader that decodes them on a thread pool so the GUI stays responsive and moves the decoded
+images into disk-backed memory maps. The loaded channels are aligned in the background as well.
 """
 
-from typing import Union
+import os
+import tempfile
+from functools import lru_cache
+from typing import List, Union
 
 import numpy as np
 import rawpy  # type: ignore
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import QFileDialog, QWidget
 
+from ..core.align import align_images
 
-def load_raw_image(parent: QWidget) -> Union[tuple[np.ndarray, None], tuple[None, str]]:
+# Images smaller than this (in bytes) are kept in RAM; spilling them would not be worth the extra copy
+SPILL_MIN_BYTES = 32 * 1024 * 1024
+
+# File systems keeping their files in RAM, where spilling an image saves no memory
+MEMORY_FILE_SYSTEMS = ("tmpfs", "ramfs")
+
+
+def select_raw_file(parent: QWidget) -> str:
     """
-    Opens a file dialog for the user to select a Sony ARW RAW image,
-    loads the image using rawpy, and processes it to an 8-bit RGB image.
+    Opens a file dialog for the user to select a Sony ARW RAW image.
 
     Args:
         parent (QWidget): The parent widget for the QFileDialog (typically the main window).
 
+    Returns:
+        str: Path of the selected file, or an empty string if the dialog was cancelled.
+
+    Cross-references:
+        - handlers.channels.load_channel
+    """
+    options = QFileDialog.Options()
+    filename, _ = QFileDialog.getOpenFileName(parent, "Select ARW File", "", "Sony RAW Files (*.arw)", options=options)
+    return filename
+
+
+def read_raw_image(filename: str) -> Union[tuple[np.ndarray, None], tuple[None, str]]:
+    """
+    Loads a Sony ARW RAW image using rawpy and processes it to an 8-bit RGB image.
+
+    Only touches the file and the returned array, so it can run outside the GUI thread.
+
+    Args:
+        filename (str): Path of the ARW file.
+
     Returns:
         tuple: Either (numpy.ndarray, None) with the 3D RGB image as a NumPy array
         (dtype=uint8, shape: HxWx3) and no error, or (None, str) with an error message
-        if loading fails or is cancelled.
+        if loading fails.
 
     Workflow:
-        1. Opens a QFileDialog for ARW file selection.
-        2. Loads the selected file with rawpy and applies camera white balance.
-        3. Disables automatic brightness correction, outputs 8 bits per sample.
-        4. Returns the RGB image directly for further processing.
-        5. Handles errors gracefully, returning None and an error message.
+        1. Loads the file with rawpy and applies camera white balance.
+        2. Disables automatic brightness correction, outputs 8 bits per sample.
+        3. Returns the RGB image directly for further processing.
+        4. Handles errors gracefully, returning None and an error message.
 
     Example:
-        rgb_image, error = load_raw_image(self)
+        rgb_image, error = read_raw_image(filename)
         if error:
             print(error)
         elif rgb_image is not None:
@@ -57,14 +89,8 @@ def load_raw_image(parent: QWidget) -> Union[tuple[np.ndarray, None], tuple[None
             # Proceed with processing
 
     Cross-references:
-        - handlers.channels.load_channel
+        - RawImageLoader
     """
-    options = QFileDialog.Options()
-    filename, _ = QFileDialog.getOpenFileName(parent, "Select ARW File", "", "Sony RAW Files (*.arw)", options=options)
-
-    if not filename:
-        return None, "No file selected"
-
     try:
         with rawpy.imread(filename) as raw:
             rgb = raw.postprocess(use_camera_wb=True, no_auto_bright=True, output_bps=8)
@@ -79,3 +105,215 @@ def load_raw_image(parent: QWidget) -> Union[tuple[np.ndarray, None], tuple[None
     ) as e:  # pylint: disable=E1101
         error_message = f"Error loading ARW file: {e}"
         return None, error_message
+
+
+@lru_cache(maxsize=1)
+def _temp_dir_in_memory() -> bool:
+    """
+    Tells whether temporary files live in RAM, e.g. when the temporary directory is a tmpfs mount.
+
+    Returns:
+        bool: True if the file system holding the temporary directory is memory-backed, False if it is
+        not or cannot be determined (no /proc/mounts outside Linux).
+    """
+    temp_dir = os.path.realpath(tempfile.gettempdir())
+    fs_type = ""
+    longest = -1
+    try:
+        with open("/proc/mounts", encoding="utf-8") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Mount points escape spaces as octal sequences
+                mount_point = fields[1].replace("\\040", " ")
+                inside = temp_dir == mount_point or temp_dir.startswith(mount_point.rstrip("/") + "/")
+                if inside and len(mount_point) > longest:
+                    longest, fs_type = len(mount_point), fields[2]
+    except OSError:
+        return False
+    return fs_type in MEMORY_FILE_SYSTEMS
+
+
+def spill_to_disk(image: np.ndarray) -> np.ndarray:
+    """
+    Moves an image into a memory map backed by an anonymous temporary file.
+
+    The original RGB images are only read again when the channels are (re)aligned, so keeping them
+    demand-paged lets the operating system drop them from RAM in between. Images below SPILL_MIN_BYTES
+    stay in RAM, and so do all images when the temporary directory is memory-backed (tmpfs), where the
+    spill would only add a copy.
+
+    Args:
+        image (numpy.ndarray): Image to move out of RAM.
+
+    Returns:
+        numpy.ndarray: A read-only memory map with the same contents, or the image itself if it is kept
+        in RAM or the temporary file could not be written.
+
+    Cross-references:
+        - handlers.channels.finish_channel_load
+    """
+    if image.nbytes < SPILL_MIN_BYTES or _temp_dir_in_memory():
+        return image
+    try:
+        with tempfile.TemporaryFile() as backing:
+            spilled = np.memmap(backing, dtype=image.dtype, mode="w+", shape=image.shape)
+            spilled[...] = image
+            spilled.flush()
+    except OSError:
+        return image
+    # The map keeps its own handle on the (already unlinked) file
+    spilled.flags.writeable = False
+    return spilled
+
+
+class RawImageLoader(QObject):  # pylint: disable=too-few-public-methods
+    """
+    Decodes RAW files on a thread pool, so several channels can load in parallel.
+
+    Signals:
+        loaded(int, str, object, object, object): Emitted with the channel index, the file name, and
+            either the RGB image, its grayscale conversion and None, or None, None and an error message.
+            Connected slots run in the thread the loader lives in (the GUI thread).
+    """
+
+    loaded = pyqtSignal(int, str, object, object, object)
+
+    def __init__(self, parent: Union[QObject, None] = None) -> None:
+        """
+        Initialize the loader with its own thread pool (one thread per core).
+
+        Args:
+            parent (QObject | None): Parent object.
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+
+    def load(self, channel_idx: int, filename: str) -> None:
+        """
+        Start decoding a RAW file for a channel; loaded is emitted once it is done.
+
+        Args:
+            channel_idx (int): Index of the channel the image is for (0=R, 1=G, 2=B).
+            filename (str): Path of the ARW file.
+
+        Returns:
+            None
+        """
+        self.pool.start(_RawLoadJob(self, channel_idx, filename))
+
+
+class _RawLoadJob(QRunnable):  # pylint: disable=too-few-public-methods
+    """
+    Thread pool job reading one RAW file for RawImageLoader.
+    """
+
+    def __init__(self, loader: RawImageLoader, channel_idx: int, filename: str) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            loader (RawImageLoader): Loader whose loaded signal reports the result.
+            channel_idx (int): Index of the channel the image is for (0=R, 1=G, 2=B).
+            filename (str): Path of the ARW file.
+        """
+        super().__init__()
+        self.loader = loader
+        self.channel_idx = channel_idx
+        self.filename = filename
+
+    def run(self) -> None:
+        """
+        Decode the file and convert it to grayscale in a pool thread, then report the result.
+        """
+        try:
+            image, err_msg = read_raw_image(self.filename)
+            gray = None
+            if image is not None:
+                # OpenCV is imported lazily so it does not weigh on application startup
+                import cv2  # pylint: disable=import-outside-toplevel
+
+                # Convert while the decoded image is still in memory, before it is spilled
+                gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)  # pylint: disable=E1101
+                image = spill_to_disk(image)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Besides the errors read_raw_image reports, other LibRaw errors (e.g. a truncated file),
+            # OpenCV errors or running out of memory must be reported as well: an exception escaping
+            # run() would abort the application
+            self.loader.loaded.emit(self.channel_idx, self.filename, None, None, f"Error loading ARW file: {e}")
+            return
+        self.loader.loaded.emit(self.channel_idx, self.filename, image, gray, err_msg)
+
+
+class ImageAligner(QObject):  # pylint: disable=too-few-public-methods
+    """
+    Aligns the three loaded channels on a background thread, so the GUI keeps painting meanwhile.
+
+    Signals:
+        aligned(object, object, object, object): Emitted with the grayscale images that were aligned,
+            then either the aligned grayscale images as one (3, H, W) stack, the aligned RGB images and
+            None, or None, None and an error message. Connected slots run in the thread the aligner
+            lives in (the GUI thread).
+    """
+
+    aligned = pyqtSignal(object, object, object, object)
+
+    def __init__(self, parent: Union[QObject, None] = None) -> None:
+        """
+        Initialize the aligner with a single-thread pool, so alignments run one at a time.
+
+        Args:
+            parent (QObject | None): Parent object.
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def align(self, grayscale_images: List[np.ndarray], rgb_images: List[np.ndarray]) -> None:
+        """
+        Start aligning the channels; aligned is emitted once it is done.
+
+        Args:
+            grayscale_images (list of numpy.ndarray): Grayscale images of the R, G and B channels.
+            rgb_images (list of numpy.ndarray): RGB images of the R, G and B channels.
+
+        Returns:
+            None
+        """
+        self.pool.start(_AlignJob(self, grayscale_images, rgb_images))
+
+
+class _AlignJob(QRunnable):  # pylint: disable=too-few-public-methods
+    """
+    Thread pool job aligning the channels for ImageAligner.
+    """
+
+    def __init__(self, aligner: ImageAligner, grayscale_images: List[np.ndarray], rgb_images: List[np.ndarray]) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            aligner (ImageAligner): Aligner whose aligned signal reports the result.
+            grayscale_images (list of numpy.ndarray): Grayscale images of the R, G and B channels.
+            rgb_images (list of numpy.ndarray): RGB images of the R, G and B channels.
+        """
+        super().__init__()
+        self.aligner = aligner
+        self.grayscale_images = grayscale_images
+        self.rgb_images = rgb_images
+
+    def run(self) -> None:
+        """
+        Align the channels in a pool thread and report the result.
+        """
+        try:
+            aligned_gray, aligned_rgb = align_images(self.grayscale_images, self.rgb_images)
+            # Stack the aligned channels here too, so the GUI thread does not copy them
+            aligned_stack = np.stack(aligned_gray)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Besides AlignmentError, OpenCV errors or running out of memory must be reported as well: an
+            # exception escaping run() would abort the application
+            self.aligner.aligned.emit(self.grayscale_images, None, None, f"Error aligning images: {e}")
+            return
+        self.aligner.aligned.emit(self.grayscale_images, aligned_stack, aligned_rgb, None)
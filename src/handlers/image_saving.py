@@ -20,11 +20,12 @@ Handlers for saving processed images to files.
 Provides functions to save images in various formats and handle file dialogs.
 """
 
+import contextlib
 import os
 import re
-from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
-import cv2
 import numpy as np
 from PyQt5.QtCore import QRect
 from PyQt5.QtWidgets import QFileDialog
@@ -33,6 +34,10 @@ from PyQt5.QtWidgets import QFileDialog
 if TYPE_CHECKING:
     from ..main_window import MainWindow
 
+# libtiff compression schemes accepted by cv2.IMWRITE_TIFF_COMPRESSION
+TIFF_COMPRESSION_NONE = 1
+TIFF_COMPRESSION_LZW = 5
+
 
 def apply_crop(image: np.ndarray, crop_rect: QRect) -> np.ndarray:
     """
@@ -51,19 +56,31 @@ def apply_crop(image: np.ndarray, crop_rect: QRect) -> np.ndarray:
     if crop_rect is None or not crop_rect.isValid():
         return image
 
+    # Apply crop
+    return image[_crop_slices(image.shape, crop_rect)]
+
+
+def _crop_slices(image_shape: Tuple[int, ...], crop_rect: QRect) -> Tuple[slice, slice]:
+    """
+    Clamp a crop rectangle to the bounds of an image and express it as slices.
+
+    Args:
+        image_shape: Shape of the image the crop applies to (height first, then width)
+        crop_rect: Valid QRect defining the crop region
+
+    Returns:
+        Tuple of (row slice, column slice) lying within the image
+    """
     x, y, w, h = crop_rect.x(), crop_rect.y(), crop_rect.width(), crop_rect.height()
 
     # Ensure crop rectangle is within image bounds
-    img_h, img_w = image.shape[:2]
+    img_h, img_w = image_shape[:2]
     x = max(0, min(x, img_w - 1))
     y = max(0, min(y, img_h - 1))
     w = max(1, min(w, img_w - x))
     h = max(1, min(h, img_h - y))
 
-    cropped_image = image[y : y + h, x : x + w]
-
-    # Apply crop
-    return cropped_image
+    return slice(y, y + h), slice(x, x + w)
 
 
 def _extract_extension_from_filter(filter_str: str) -> Optional[str]:
@@ -140,19 +157,39 @@ def _save_cropped_images(
     # Get the filename without extension and the extension
     filename_without_ext, extension = os.path.splitext(filepath)
 
+    # All channels share dimensions after alignment, so clamp the crop once for the whole set
+    first_img = next((img for img in images if img is not None), None)
+    crop_slices: Tuple[slice, ...] = ()
+    if first_img is not None and crop_rect and crop_rect.isValid():
+        crop_slices = _crop_slices(first_img.shape, crop_rect)
+
     for idx, img in enumerate(images):
         if img is not None:
-            # Apply crop if needed
-            img_to_save = apply_crop(img, crop_rect) if crop_rect and crop_rect.isValid() else img.copy()
-
             # Create filename with channel suffix
             channel_path = f"{filename_without_ext}_{channel_names[idx]}{extension}"
-            success, message = save_image(img_to_save, channel_path, file_format, is_bgr=True)
+            # Apply crop if needed (a view is enough, save_image never modifies its input)
+            success, message = save_image(img[crop_slices], channel_path, file_format, is_bgr=True)
             results.append((success, message))
 
     return results
 
 
+def _combined_crop(image_shape: Tuple[int, ...], crop_rect: Optional[QRect]) -> Tuple[slice, slice]:
+    """
+    Get the slices selecting the saved region of an image.
+
+    Args:
+        image_shape: Shape of the image the crop applies to (height first, then width)
+        crop_rect: Optional crop rectangle
+
+    Returns:
+        Tuple of (row slice, column slice); the whole image when no valid crop is set
+    """
+    if crop_rect and crop_rect.isValid():
+        return _crop_slices(image_shape, crop_rect)
+    return slice(0, image_shape[0]), slice(0, image_shape[1])
+
+
 def _create_combined_image(
     aligned_images: Sequence[Optional[np.ndarray]], crop_rect: Optional[QRect]
 ) -> Optional[np.ndarray]:
@@ -166,34 +203,29 @@ def _create_combined_image(
     Returns:
         Combined RGB image or None if no valid channels
     """
-    available_channels = [img is not None for img in aligned_images]
-
-    if not any(available_channels):
-        return None
-
-    # Find first valid image to get dimensions
-    img_shape = None
-    for img in aligned_images:
-        if img is not None:
-            img_shape = img.shape
-            break
-
-    if img_shape is None:
-        return None
-
-    # Initialize empty channels
-    r_channel = np.zeros(img_shape, dtype=np.uint8)
-    g_channel = np.zeros(img_shape, dtype=np.uint8)
-    b_channel = np.zeros(img_shape, dtype=np.uint8)
-
-    # Fill in available channels with cropped versions
-    channels = [r_channel, g_channel, b_channel]
-    for i, img in enumerate(aligned_images):
-        if img is not None:
-            channels[i] = apply_crop(img, crop_rect) if crop_rect and crop_rect.isValid() else img
-
-    # Combine BGR channels (OpenCV uses BGR order)
-    return cv2.merge([channels[2], channels[1], channels[0]])  # pylint: disable=E1101
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
+
+    red, green, blue = aligned_images
+    if red is not None and green is not None and blue is not None:
+        # Common case: every channel is loaded, so no scan or black plane is needed
+        crop = _combined_crop(red.shape, crop_rect)
+        planes = [blue[crop], green[crop], red[crop]]  # OpenCV uses BGR order
+    else:
+        # Find first valid image to get dimensions; this also tells whether any channel is available
+        first_img = next((img for img in aligned_images if img is not None), None)
+        if first_img is None:
+            return None
+
+        # Cropped views of the available channels (no copies); missing channels stay black
+        crop = _combined_crop(first_img.shape, crop_rect)
+        black = np.zeros_like(first_img[crop])
+        planes = [img[crop] if img is not None else black for img in (blue, green, red)]
+
+    # Interleave all planes into the preallocated output in a single vectorized pass
+    combined = np.empty((*planes[0].shape, 3), dtype=np.uint8)
+    cv2.merge(planes, dst=combined)  # pylint: disable=E1101
+    return combined
 
 
 def save_image_with_dialog(main_window: "MainWindow") -> Tuple[bool, str]:
@@ -257,8 +289,67 @@ def save_image_with_dialog(main_window: "MainWindow") -> Tuple[bool, str]:
     return True, f"Successfully saved all images to {os.path.dirname(filepath)}"
 
 
+@lru_cache(maxsize=1)
+def _imwrite_params() -> Dict[str, List[int]]:
+    """
+    Build the per-format OpenCV encoder parameters.
+
+    The table is built on first use (OpenCV is imported lazily) and cached afterwards,
+    so each save costs a single dictionary lookup.
+
+    Returns:
+        Dictionary mapping lowercase file extensions to cv2.imencode parameter lists
+    """
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
+
+    jpeg_params = [cv2.IMWRITE_JPEG_QUALITY, 95]  # pylint: disable=E1101
+    tiff_params = [cv2.IMWRITE_TIFF_COMPRESSION, TIFF_COMPRESSION_LZW]  # pylint: disable=E1101
+    return {
+        "jpg": jpeg_params,
+        "jpeg": jpeg_params,
+        "png": [cv2.IMWRITE_PNG_COMPRESSION, 3],  # pylint: disable=E1101
+        "tif": tiff_params,
+        "tiff": tiff_params,
+    }
+
+
+def _write_encoded_image(filepath: str, encoded: np.ndarray) -> None:
+    """
+    Write an encoded image buffer to disk without leaving it in the page cache.
+
+    Args:
+        filepath: Path to write the file to
+        encoded: Encoded file contents as returned by cv2.imencode
+
+    Raises:
+        OSError: If the file cannot be created or written; a partially written file is removed
+    """
+    with open(filepath, "wb") as file:
+        try:
+            # Write the array's memory directly, without an intermediate bytes copy
+            encoded.tofile(file)
+            file.flush()
+            if hasattr(os, "posix_fadvise"):
+                # Saved files are not read back: start writing their pages out in the background and
+                # let the kernel drop them from the page cache, without waiting for the disk
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            # Do not leave a truncated file behind (but never remove anything other than a regular file,
+            # such as a device the image was written to)
+            file.close()
+            if os.path.isfile(filepath):
+                with contextlib.suppress(OSError):
+                    os.remove(filepath)
+            raise
+
+
 def save_image(
-    image: np.ndarray, filepath: Optional[str] = None, file_format: Optional[str] = None, is_bgr: bool = False
+    image: np.ndarray,
+    filepath: Optional[str] = None,
+    file_format: Optional[str] = None,
+    is_bgr: bool = False,
+    compress_tiff: bool = True,
 ) -> Tuple[bool, str]:
     """
     Save a NumPy array image to a file.
@@ -268,6 +359,7 @@ def save_image(
         filepath: Path to save the file to. Required.
         file_format: Optional format override (e.g., 'jpg', 'png', 'tiff')
         is_bgr: Whether the input image is in RGB format (needs conversion to BGR)
+        compress_tiff: Whether TIFF output is LZW-compressed (lossless) or written uncompressed
 
     Returns:
         Tuple containing:
@@ -277,6 +369,9 @@ def save_image(
     if image is None or image.size == 0:
         return False, "No image data to save"
 
+    # OpenCV is imported lazily so it does not weigh on application startup
+    import cv2  # pylint: disable=import-outside-toplevel
+
     # Check if filepath is provided
     if filepath is None:
         return False, "No filepath provided"
@@ -290,26 +385,20 @@ def save_image(
 
     try:
         # Convert from RGB to BGR if needed (OpenCV uses BGR)
-        if is_bgr and len(image.shape) == 3 and image.shape[2] == 3:
+        if is_bgr and image.ndim == 3 and image.shape[-1] == 3:
             image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)  # pylint: disable=E1101
 
-        # Handle image format based on extension
-        if file_format in ["jpg", "jpeg"]:
-            success = cv2.imwrite(filepath, image, [cv2.IMWRITE_JPEG_QUALITY, 95])  # pylint: disable=E1101
-        elif file_format == "png":
-            success = cv2.imwrite(filepath, image, [cv2.IMWRITE_PNG_COMPRESSION, 9])  # pylint: disable=E1101
-        elif file_format in ["tif", "tiff"]:
-            success = cv2.imwrite(filepath, image)  # pylint: disable=E1101
-        else:
-            # Default case - try to save with the given extension
-            success = cv2.imwrite(filepath, image)  # pylint: disable=E1101
+        # Look up the encoder parameters for the format; unknown formats use OpenCV defaults
+        params = _imwrite_params().get(file_format, [])
+        if not compress_tiff and file_format in ("tif", "tiff"):
+            params = [cv2.IMWRITE_TIFF_COMPRESSION, TIFF_COMPRESSION_NONE]  # pylint: disable=E1101
 
+        # Encode in memory first (OpenCV releases the GIL while encoding), then write the bytes out
+        success, encoded = cv2.imencode(f".{file_format}", image, params)  # pylint: disable=E1101
         if success:
+            _write_encoded_image(filepath, encoded)
             return True, filepath
         return False, f"Failed to save image to {filepath}"
 
-    except (
-        FileNotFoundError,
-        PermissionError,
-    ) as e:
+    except OSError as e:
         return False, f"Error saving image: {str(e)}"
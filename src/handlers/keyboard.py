@@ -24,11 +24,17 @@ from typing import TYPE_CHECKING
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QKeyEvent
 
+from .channels import CHANNEL_VIEW_MESSAGES
 from .display import update_main_display
 
 if TYPE_CHECKING:
     from ..main_window import MainWindow
 
+# Keys showing a single channel, mapped to the channel index
+CHANNEL_KEYS: dict[int, int] = {Qt.Key.Key_1: 0, Qt.Key.Key_2: 1, Qt.Key.Key_3: 2}
+# Key showing the combined view, bound once rather than looked up through Qt on every key press
+COMBINED_KEY: int = Qt.Key.Key_A
+
 
 def handle_key_press(main_window: "MainWindow", event: QKeyEvent) -> bool:
     """
@@ -49,40 +55,30 @@ def handle_key_press(main_window: "MainWindow", event: QKeyEvent) -> bool:
 
     Behavior:
         - Updates display state in main_window
-        - Calls update_main_display() to refresh the UI
+        - Calls update_main_display() to refresh the UI, except for auto-repeats of the current view
         - Accepts the event if handled to prevent further propagation
 
     Cross-references:
         - update_main_display
         - main_window.MainWindow
     """
-    if event.key() == Qt.Key.Key_1:
-        main_window.show_combined = False
-        main_window.current_channel = 0
-        main_window.status_handler.set_message("Viewing Red channel", main_window.status_handler.MEDIUM_TIMEOUT)
-        update_main_display(main_window)
-        event.accept()
-        return True
-    if event.key() == Qt.Key.Key_2:
-        main_window.show_combined = False
-        main_window.current_channel = 1
-        main_window.status_handler.set_message("Viewing Green channel", main_window.status_handler.MEDIUM_TIMEOUT)
-        update_main_display(main_window)
-        event.accept()
-        return True
-    if event.key() == Qt.Key.Key_3:
-        main_window.show_combined = False
-        main_window.current_channel = 2
-        main_window.status_handler.set_message("Viewing Blue channel", main_window.status_handler.MEDIUM_TIMEOUT)
-        update_main_display(main_window)
-        event.accept()
-        return True
-    if event.key() == Qt.Key.Key_A:
-        main_window.show_combined = True
-        main_window.status_handler.set_message(
-            "Viewing combined RGB channel", main_window.status_handler.MEDIUM_TIMEOUT
-        )
+    key = event.key()
+    channel_idx = CHANNEL_KEYS.get(key)
+    if channel_idx is not None:
+        show_combined, current_channel = False, channel_idx
+        message = CHANNEL_VIEW_MESSAGES[channel_idx]
+    elif key == COMBINED_KEY:
+        show_combined, current_channel = True, main_window.current_channel
+        message = "Viewing combined RGB channel"
+    else:
+        return False
+
+    # A held key repeats at the keyboard rate; the view only needs refreshing when it changes
+    unchanged = main_window.show_combined == show_combined and main_window.current_channel == current_channel
+    main_window.show_combined = show_combined
+    main_window.current_channel = current_channel
+    main_window.status_handler.set_message(message, main_window.status_handler.MEDIUM_TIMEOUT)
+    if not (unchanged and event.isAutoRepeat()):
         update_main_display(main_window)
-        event.accept()
-        return True
-    return False
+    event.accept()
+    return True
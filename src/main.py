@@ -26,12 +26,14 @@ Usage:
 
 Modules:
     sys: Provides access to command-line arguments and system exit.
+    PyQt5.QtCore.Qt: Application attributes for high-DPI rendering.
     PyQt5.QtWidgets.QApplication: Manages the Qt application event loop.
     main_window.MainWindow: Main window class for the application.
 """
 
 import sys
 
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
 from .main_window import MainWindow
@@ -41,8 +43,9 @@ def main() -> None:
     """
     Initialize and run the Prokudin application.
 
-    This function creates a QApplication instance, instantiates and displays the main window,
-    and starts the Qt event loop. The application will exit when the main window is closed.
+    This function enables high-DPI scaling, creates a QApplication instance, instantiates and
+    displays the main window, and starts the Qt event loop. The application will exit when the
+    main window is closed.
 
     Args:
         None
@@ -50,10 +53,14 @@ def main() -> None:
     Returns:
         None
     """
+    # High-DPI attributes must be set before the QApplication is created
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec_())
+    sys.exit(app.exec())
 
 
 if __name__ == "__main__":
@@ -20,25 +20,40 @@ Main application window and UI layout for Prokudin.
 Handles state management, user interactions, and connects UI components to processing logic.
 """
 
+from collections import OrderedDict
+from functools import lru_cache, partial
 from typing import Callable, Union
 
-from PyQt5.QtCore import QRect, Qt
-from PyQt5.QtGui import QKeyEvent, QMouseEvent
+import numpy as np
+from PyQt5.QtCore import QRect, QSignalBlocker, Qt, QThread, QTimer
+from PyQt5.QtGui import QCloseEvent, QImage, QKeyEvent, QPixmap
 from PyQt5.QtWidgets import (
     QApplication,
     QComboBox,
     QHBoxLayout,
-    QLabel,
     QMainWindow,
     QPushButton,
+    QStackedWidget,
     QStatusBar,
     QVBoxLayout,
     QWidget,
 )
 
+from .core.pipeline_worker import PipelineWorker
 from .default_state import DefaultState
-from .handlers.channels import adjust_channel, load_channel, show_single_channel, update_channel_preview
-from .handlers.display import show_combined_image, show_single_channel_image, update_main_display
+from .handlers.channels import (
+    CHANNEL_VIEW_MESSAGES,
+    apply_channel_result,
+    finish_channel_alignment,
+    finish_channel_load,
+    flush_channel_adjustment,
+    load_channel,
+    schedule_channel_adjustment,
+    show_single_channel,
+    update_channel_previews,
+)
+from .handlers.display import DisplayComposer, current_view_key, finish_display_frame, update_main_display
+from .handlers.image_loading import ImageAligner, RawImageLoader
 from .handlers.image_saving import save_image_with_dialog
 from .handlers.keyboard import handle_key_press
 from .widgets.channel_controller import ChannelController
@@ -46,6 +61,66 @@ from .widgets.grid_settings_dialog import GRID_TYPE_3X3, GRID_TYPE_GOLDEN_RATIO,
 from .widgets.image_viewer import ImageViewer
 from .widgets.status_bar import StatusBarHandler
 
+# Crop aspect ratios offered in the ratio combo box as (label, (width, height)), None for a free crop
+CROP_RATIOS: tuple[tuple[str, Union[tuple[int, int], None]], ...] = (
+    ("Free", None),
+    ("16:9", (16, 9)),
+    ("3:2", (3, 2)),
+    ("4:3", (4, 3)),
+    ("5:4", (5, 4)),
+    ("1:1", (1, 1)),
+    ("4:5", (4, 5)),
+    ("3:4", (3, 4)),
+    ("2:3", (2, 3)),
+    ("9:16", (9, 16)),
+)
+
+# Controller name and identification color of each channel (0=R, 1=G, 2=B)
+CHANNEL_COLORS: tuple[tuple[str, Qt.GlobalColor], ...] = (
+    ("red", Qt.GlobalColor.red),
+    ("green", Qt.GlobalColor.green),
+    ("blue", Qt.GlobalColor.blue),
+)
+
+# Interval (ms) within which bursts of slider changes are coalesced into a single pipeline run, about one frame
+ADJUST_DEBOUNCE_MS = 16
+
+
+@lru_cache(maxsize=64)
+def _fit_aspect_rect(
+    width: int, height: int, center_x: int, center_y: int, ratio: tuple[int, int]
+) -> Union[tuple[int, int, int, int], None]:
+    """
+    Computes the largest rectangle with an aspect ratio that fits within a rectangle, centered on it.
+
+    Results are cached, since the same few ratios are applied to the same rectangles over and over.
+
+    Args:
+        width (int): Width of the original rectangle.
+        height (int): Height of the original rectangle.
+        center_x (int): Horizontal center of the original rectangle.
+        center_y (int): Vertical center of the original rectangle.
+        ratio (tuple): The desired aspect ratio as (width, height).
+
+    Returns:
+        tuple | None: (left, top, width, height) of the fitted rectangle, or None when the original
+        rectangle already has the ratio.
+
+    Cross-references:
+        - MainWindow._get_aspect_crop_rect
+    """
+    ratio_w, ratio_h = ratio
+    # Try to maintain width first; integer arithmetic keeps the ratio exact (no float rounding)
+    new_w = width
+    new_h = width * ratio_h // ratio_w
+    if new_h > height:
+        new_h = height
+        new_w = height * ratio_w // ratio_h
+    if new_w == width and new_h == height:
+        # Already has the ratio: keep it in place rather than re-centering it (which shifts even sizes)
+        return None
+    return center_x - new_w // 2, center_y - new_h // 2, new_w, new_h
+
 
 class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
     """
@@ -81,10 +156,40 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         # State: original, aligned, and processed images for R, G, B channels
         self.original_images = [None, None, None]
         self.aligned = [None, None, None]
+        # Once all channels are aligned, aligned entries are views into one contiguous (3, H, W) stack
+        self.aligned_stack: Union[np.ndarray, None] = None
+        # Per channel, subsampled aligned images (see DRAFT_STRIDES) used for drafts while a slider is dragged
+        self.aligned_pyramid: list[list[np.ndarray]] = [[], [], []]
+        # Scratch arrays reused by every draft: the adjusted channel level and the combined draft
+        self.draft_buffers: list[Union[np.ndarray, None]] = [None, None]
         self.processed = [None, None, None]
+        # Bit i is set once channel i has a processed image, so loadedness checks are a single integer test
+        self.processed_mask = 0
+        # Once all channels are aligned, processed entries are views into one contiguous (3, H, W) stack;
+        # in-place updates of the stack bump processed_version
+        self.processed_stack: Union[np.ndarray, None] = None
+        self.processed_version = 0
+        # Per channel count of in-place updates, telling which planes of the display buffer are stale
+        self.channel_versions = [0, 0, 0]
         # Add original RGB images storage
         self.original_rgb_images = [None, None, None]
         self.aligned_rgb = [None, None, None]
+        # Last adjustment per channel as (aligned source, brightness, contrast), used to skip recomputation
+        self.adjust_cache: list[Union[tuple[np.ndarray, int, int], None]] = [None, None, None]
+        # Recent adjustment results as (channel, brightness, contrast) -> (aligned source, result), oldest first
+        self.adjust_results: OrderedDict[tuple[int, int, int], tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        # Recent combined views as (version, intensities, crop) -> (processed images, pixmap, QImage whose
+        # memory the pixmap shares or None if it owns its pixels), oldest first
+        self.composite_cache: OrderedDict[tuple, tuple[tuple, QPixmap, Union[QImage, None]]] = OrderedDict()
+        # Two persistent 32-bit RGB buffers for the main view, each as (NumPy view, QImage owning its memory):
+        # one is on screen while the other is composed
+        self.display_buffers: list[Union[tuple[np.ndarray, QImage], None]] = [None, None]
+        # What each display buffer holds: (crop, per channel (processed image, version, intensity))
+        self.display_contents: list[Union[tuple[Union[tuple, None], tuple], None]] = [None, None]
+        # The display buffer image currently shown, and the view it shows (see current_view_key) or None
+        # when that is a draft or a crop cut from the previous image
+        self.display_shown: Union[QImage, None] = None
+        self.display_key: Union[tuple, None] = None
 
         # Display state - use defaults from DefaultState
         self.show_combined = DefaultState.SHOW_COMBINED
@@ -94,10 +199,42 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         self.crop_mode = DefaultState.CROP_MODE
         self.crop_rect: Union[QRect, None] = None
         self.crop_ratio: Union[tuple[int, int], None] = None
+        # (height, width) of the loaded channels, recorded at load time for crop initialization
+        self.canvas_shape: Union[tuple[int, int], None] = None
+        # A refresh of the channel previews is scheduled after a crop was applied
+        self.crop_previews_pending = False
 
         # Grid settings dialog (initially None, created on demand)
         self.grid_settings_dialog: Union[GridSettingsDialog, None] = None
 
+        # Channel adjustments run on a worker thread so the UI stays responsive on large images
+        self.pipeline_thread = QThread(self)
+        self.pipeline_worker = PipelineWorker()
+        self.pipeline_worker.moveToThread(self.pipeline_thread)
+        self.pipeline_worker.result_ready.connect(partial(apply_channel_result, self))
+        self.pipeline_thread.start()
+
+        # RAW files are decoded on a thread pool; the file last requested per channel is kept in
+        # pending_loads so that superseded results are dropped
+        self.raw_loader = RawImageLoader(self)
+        self.raw_loader.loaded.connect(partial(finish_channel_load, self))
+        self.pending_loads: list[Union[str, None]] = [None, None, None]
+        # Loaded channels are aligned in the background; results for images replaced meanwhile are dropped
+        self.image_aligner = ImageAligner(self)
+        self.image_aligner.aligned.connect(partial(finish_channel_alignment, self))
+
+        # Full-resolution views are composed in the background, one frame at a time
+        self.display_composer = DisplayComposer(self)
+        self.display_composer.composed.connect(partial(finish_display_frame, self))
+
+        # Key bindings handled by the window itself, in and out of crop mode (see keyPressEvent)
+        self.crop_key_actions: dict[int, Callable[[], None]] = {
+            Qt.Key.Key_Escape: self.cancel_crop,
+            Qt.Key.Key_Return: self.apply_crop,
+            Qt.Key.Key_Enter: self.apply_crop,
+        }
+        self.key_actions: dict[int, Callable[[], None]] = {Qt.Key.Key_C: self.toggle_crop_mode}
+
         self.init_ui()
 
         # Update the mode based on initial state
@@ -120,7 +257,7 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         Cross-references:
             - ImageViewer
             - ChannelController
-            - handlers.channels.load_channel, adjust_channel, update_channel_preview, show_single_channel
+            - handlers.channels.load_channel, schedule_channel_adjustment, update_channel_preview, show_single_channel
         """
         main_widget = QWidget()
         main_layout = QHBoxLayout(main_widget)
@@ -143,31 +280,15 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         self.crop_mode_btn = QPushButton("Crop")
         self.crop_mode_btn.clicked.connect(self.toggle_crop_mode)
 
-        # Crop controls widget (already present)
-        self.crop_ratio_combo = QComboBox()
-        self.crop_ratio_combo.addItem("Free", None)
-        self.crop_ratio_combo.addItem("16:9", (16, 9))
-        self.crop_ratio_combo.addItem("3:2", (3, 2))
-        self.crop_ratio_combo.addItem("4:3", (4, 3))
-        self.crop_ratio_combo.addItem("5:4", (5, 4))
-        self.crop_ratio_combo.addItem("1:1", (1, 1))
-        self.crop_ratio_combo.addItem("4:5", (4, 5))
-        self.crop_ratio_combo.addItem("3:4", (3, 4))
-        self.crop_ratio_combo.addItem("2:3", (2, 3))
-        self.crop_ratio_combo.addItem("9:16", (9, 16))
-        self.crop_ratio_combo.currentIndexChanged.connect(self.set_crop_ratio)
-
-        self.crop_controls_widget = QWidget()
-        crop_controls_layout = QHBoxLayout(self.crop_controls_widget)
-        crop_controls_layout.setContentsMargins(0, 0, 0, 0)
-        crop_controls_layout.addWidget(self.crop_ratio_combo)
-        self.accept_crop_btn = QPushButton("Accept Crop")
-        self.accept_crop_btn.clicked.connect(self.apply_crop)
-        crop_controls_layout.addWidget(self.accept_crop_btn)
-        self.cancel_crop_btn = QPushButton("Cancel Crop")
-        self.cancel_crop_btn.clicked.connect(self.cancel_crop)
-        crop_controls_layout.addWidget(self.cancel_crop_btn)
-        self.crop_controls_widget.setVisible(False)
+        # The crop button and the crop controls take turns in one slot, so entering or leaving crop
+        # mode switches pages instead of re-laying out the window (and resizing the viewer). The crop
+        # controls are only built the first time crop mode is entered (see _build_crop_controls).
+        self.crop_ratio_combo: Union[QComboBox, None] = None
+        self.crop_controls_widget: Union[QWidget, None] = None
+        self.accept_crop_btn: Union[QPushButton, None] = None
+        self.cancel_crop_btn: Union[QPushButton, None] = None
+        self.crop_stack = QStackedWidget()
+        self.crop_stack.addWidget(self.crop_mode_btn)
 
         # Left sidebar for tool buttons
         left_sidebar = QVBoxLayout()
@@ -187,11 +308,10 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         buttons_layout = QHBoxLayout()
         buttons_layout.addWidget(self.new_btn)
         buttons_layout.addWidget(self.save_btn)
-        buttons_layout.addWidget(self.crop_mode_btn)
+        buttons_layout.addWidget(self.crop_stack)
 
         # Add the buttons layout to the center panel
         center_panel.addLayout(buttons_layout)
-        center_panel.addWidget(self.crop_controls_widget)
         self.viewer = ImageViewer()
         center_panel.addWidget(self.viewer, 70)
 
@@ -199,70 +319,34 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
 
         # Right panel with channel controllers
         right_panel = QVBoxLayout()
-        self.controllers = [
-            ChannelController("red", Qt.GlobalColor.red),
-            ChannelController("green", Qt.GlobalColor.green),
-            ChannelController("blue", Qt.GlobalColor.blue),
-        ]
+        self.controllers = [ChannelController(name, color) for name, color in CHANNEL_COLORS]
+        self.adjust_timers: list[QTimer] = []
+        self.adjust_pending = [False] * len(self.controllers)
+        # Display refreshes requested by several channels within one frame are merged into one composite
+        self.display_timer = QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.setInterval(ADJUST_DEBOUNCE_MS)
+        self.display_timer.timeout.connect(partial(update_main_display, self))
 
         for idx, controller in enumerate(self.controllers):
             # Connect load button and sliders to handlers
-            controller.btn_load.clicked.connect(lambda _, i=idx: load_channel(self, i))
-
-            # Connect controller value changes to adjust channel (handles both slider and text input)
-            controller.value_changed.connect(lambda i=idx: adjust_channel(self, i))
-
-            # Fix the mousePressEvent assignment with properly typed functions
-            # Pass controller as an argument to avoid cell-var-from-loop issue
-            def create_click_handler(index: int, ctrl: ChannelController = controller) -> Callable[[QMouseEvent], None]:
-                """
-                Creates a click handler function for channel preview labels.
-
-                This factory function generates a click handler that shows a single channel
-                when its preview label is clicked, while maintaining the original behavior
-                of the QLabel's mousePressEvent.
-
-                Parameters
-                ----------
-                index : int
-                    The index of the channel to display when clicked.
-                ctrl : ChannelController, optional
-                    The channel controller instance to use. Defaults to the global controller.
-
-                Returns
-                -------
-                Callable[[QMouseEvent], None]
-                    A function that handles mouse press events on channel preview labels.
-                """
-
-                def click_handler(event: QMouseEvent) -> None:
-                    """
-                    Handle mouse click events on the channel preview label.
-
-                    This function shows a single channel when the preview label is clicked and then
-                    passes the event to the original mousePressEvent method to maintain expected behavior.
-
-                    Parameters
-                    ----------
-                    event : QMouseEvent
-                        The mouse event that triggered this handler.
-
-                    Returns
-                    -------
-                    None
-                    """
-                    self.status_handler.set_message(
-                        f"Viewing {ctrl.channel_name.capitalize()} channel", self.status_handler.MEDIUM_TIMEOUT
-                    )
-                    show_single_channel(self, index)
-                    # Call the original method to maintain expected behavior
-                    QLabel.mousePressEvent(ctrl.preview_label, event)
-
-                return click_handler
-
-            # Instead of directly assigning to mousePressEvent, connect to a custom event filter
-            # or subclass QLabel - for now, we'll keep the assignment but add a type ignore comment
-            controller.preview_label.mousePressEvent = create_click_handler(idx)  # type: ignore
+            controller.btn_load.clicked.connect(partial(load_channel, self, idx))
+
+            # Connect controller value changes to adjust channel (handles both slider and text input).
+            # A drag emits one change per slider tick, so changes are throttled: the first change runs
+            # right away and later ones within the same frame are folded into one trailing run with the
+            # latest values. While a slider is held down only a low-resolution draft is shown; releasing
+            # it runs the full pipeline.
+            adjust_timer = QTimer(self)
+            adjust_timer.setSingleShot(True)
+            adjust_timer.setInterval(ADJUST_DEBOUNCE_MS)
+            adjust_timer.timeout.connect(partial(flush_channel_adjustment, self, idx))
+            controller.value_changed.connect(partial(schedule_channel_adjustment, self, idx))
+            controller.slider_released.connect(partial(schedule_channel_adjustment, self, idx))
+            self.adjust_timers.append(adjust_timer)
+
+            # Clicks on the preview label show that channel
+            controller.preview_label.clicked.connect(partial(self._on_preview_clicked, idx))
 
             right_panel.addWidget(controller)
         right_panel.addStretch()
@@ -273,6 +357,40 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         # After connecting all signals for loading/adjusting channels, update save button state
         self.update_save_button_state()
 
+    def schedule_main_display(self) -> None:
+        """
+        Request a refresh of the main display, coalescing repeated requests into a single update.
+
+        Args:
+            self (MainWindow): The instance of the main window.
+
+        Returns:
+            None
+
+        Cross-references:
+            - update_main_display
+        """
+        if not self.display_timer.isActive():
+            self.display_timer.start()
+
+    def flush_main_display(self) -> None:
+        """
+        Refresh the main display right away, absorbing any refresh already scheduled.
+
+        Used by callers that are themselves debounced, so the change is not delayed by a second frame.
+
+        Args:
+            self (MainWindow): The instance of the main window.
+
+        Returns:
+            None
+
+        Cross-references:
+            - update_main_display
+        """
+        self.display_timer.stop()
+        update_main_display(self)
+
     def _update_mode_from_state(self) -> None:
         """
         Updates the mode indicator based on the current application state.
@@ -283,9 +401,38 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         Returns:
             None
         """
-        loaded_channels = sum(1 for img in self.original_images if img is not None)
+        # Every loaded channel has its bit set in processed_mask
+        loaded_channels = self.processed_mask.bit_count()
         self.status_handler.update_mode_from_state(loaded_channels, self.crop_mode)
 
+    def _build_crop_controls(self) -> QWidget:
+        """
+        Create the crop ratio combo box and the accept and cancel buttons, as the crop stack's second page.
+
+        Args:
+            self (MainWindow): The instance of the main window.
+
+        Returns:
+            QWidget: The crop controls widget.
+        """
+        self.crop_ratio_combo = QComboBox()
+        self.crop_ratio_combo.addItems([label for label, _ in CROP_RATIOS])
+        self.crop_ratio_combo.currentIndexChanged.connect(self.set_crop_ratio)
+
+        self.crop_controls_widget = QWidget()
+        crop_controls_layout = QHBoxLayout(self.crop_controls_widget)
+        crop_controls_layout.setContentsMargins(0, 0, 0, 0)
+        crop_controls_layout.addWidget(self.crop_ratio_combo)
+        self.accept_crop_btn = QPushButton("Accept Crop")
+        self.accept_crop_btn.clicked.connect(self.apply_crop)
+        crop_controls_layout.addWidget(self.accept_crop_btn)
+        self.cancel_crop_btn = QPushButton("Cancel Crop")
+        self.cancel_crop_btn.clicked.connect(self.cancel_crop)
+        crop_controls_layout.addWidget(self.cancel_crop_btn)
+
+        self.crop_stack.addWidget(self.crop_controls_widget)
+        return self.crop_controls_widget
+
     def toggle_crop_mode(self) -> None:
         """
         Toggles the crop mode in the application.
@@ -306,32 +453,28 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         """
         if self.crop_mode:
             return
-        if not any(img is not None for img in self.processed):
+        if not self.processed_mask:
             return  # Add error message in UI
         self.crop_mode = True
-        self.crop_mode_btn.setVisible(False)
-        self.crop_controls_widget.setVisible(True)
+        self.crop_stack.setCurrentWidget(self.crop_controls_widget or self._build_crop_controls())
         # Use last saved crop rectangle if available
         saved_crop_rect = self.viewer.get_saved_crop_rect() if self.viewer else None
         if saved_crop_rect:
             self.crop_rect = QRect(saved_crop_rect)
-        else:
-            if any(img is not None for img in self.processed):
-                for img in self.processed:
-                    if img is not None:
-                        img_w, img_h = img.shape[1], img.shape[0]
-                        rect_w = int(img_w * 0.8)
-                        rect_h = int(img_h * 0.8)
-                        x = (img_w - rect_w) // 2
-                        y = (img_h - rect_h) // 2
-                        self.crop_rect = QRect(x, y, rect_w, rect_h)
-                        break
-                if self.crop_ratio and self.crop_rect is not None:
-                    self.crop_rect = self._get_aspect_crop_rect(self.crop_rect, self.crop_ratio)
+        elif self.canvas_shape is not None:
+            img_h, img_w = self.canvas_shape
+            rect_w = int(img_w * 0.8)
+            rect_h = int(img_h * 0.8)
+            x = (img_w - rect_w) // 2
+            y = (img_h - rect_h) // 2
+            self.crop_rect = QRect(x, y, rect_w, rect_h)
+            if self.crop_ratio:
+                self.crop_rect = self._get_aspect_crop_rect(self.crop_rect, self.crop_ratio)
         self.viewer.set_crop_mode(self.crop_mode)
         if self.crop_rect:
             self.viewer.set_crop_rect(self.crop_rect)
-        update_main_display(self)
+        # Without a saved crop the full image is already shown; only the crop overlay appears
+        update_main_display(self, repaint_only=saved_crop_rect is None)
 
         # Update mode indicator and status message
         self._update_mode_from_state()
@@ -355,8 +498,7 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
             - update_main_display
         """
         self.crop_mode = False
-        self.crop_mode_btn.setVisible(True)
-        self.crop_controls_widget.setVisible(False)
+        self.crop_stack.setCurrentWidget(self.crop_mode_btn)
         saved_crop_rect = self.viewer.get_saved_crop_rect() if self.viewer else None
         if saved_crop_rect:
             self.crop_rect = QRect(saved_crop_rect)
@@ -364,7 +506,8 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         else:
             self.crop_rect = None
         self.viewer.set_crop_mode(False)
-        update_main_display(self)
+        # Without a saved crop the full image stays on screen; only the crop overlay goes away
+        update_main_display(self, repaint_only=saved_crop_rect is None)
 
         # Update mode indicator and status message
         self._update_mode_from_state()
@@ -386,23 +529,25 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
 
         Cross-references:
             - ImageViewer.set_crop_ratio
-            - update_main_display
         """
-        self.crop_ratio = self.crop_ratio_combo.currentData()
+        if self.crop_ratio_combo is None:
+            return
+        ratio = CROP_RATIOS[self.crop_ratio_combo.currentIndex()][1]
         # Always get the current rectangle from the viewer
         current_rect = self.viewer.get_crop_rect() if self.viewer else self.crop_rect
-        if current_rect and self.crop_ratio:
-            new_rect = self._get_aspect_crop_rect(current_rect, self.crop_ratio)
-            self.crop_rect = new_rect
-            self.viewer.set_crop_ratio(self.crop_ratio)
-            self.viewer.set_crop_rect(new_rect)
-            # Keep viewer._crop_rect and self.crop_rect in sync
-        elif current_rect:
-            # Free mode
-            self.viewer.set_crop_ratio(None)
-            self.viewer.set_crop_rect(current_rect)
-            self.crop_rect = current_rect
-        update_main_display(self)
+        # A repeated signal for the ratio already applied to the current rectangle changes nothing
+        if ratio == self.crop_ratio and current_rect is not None and current_rect == self.crop_rect:
+            return
+        self.crop_ratio = ratio
+        if not current_rect:
+            return
+        # Free mode keeps the rectangle as is
+        new_rect = self._get_aspect_crop_rect(current_rect, ratio) if ratio else current_rect
+        self.crop_rect = new_rect
+        # The viewer fits its rectangle to the ratio itself (anchored at the top-left corner, with float
+        # rounding), so the centered one always replaces it; only the crop overlay is repainted
+        self.viewer.set_crop_ratio(ratio)
+        self.viewer.set_crop_rect(new_rect)
 
     def _get_aspect_crop_rect(self, rect: QRect, ratio: tuple[int, int]) -> QRect:
         """
@@ -422,21 +567,9 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         """
         if not rect or not ratio:
             return rect
-        orig_w = rect.width()
-        orig_h = rect.height()
         center = rect.center()
-        w, h = ratio
-        target_ratio = w / h
-        # Try to maintain width first
-        new_w = orig_w
-        new_h = int(new_w / target_ratio)
-        if new_h > orig_h:
-            new_h = orig_h
-            new_w = int(new_h * target_ratio)
-        # Center the new rect
-        new_left = center.x() - new_w // 2
-        new_top = center.y() - new_h // 2
-        return QRect(new_left, new_top, new_w, new_h)
+        fitted = _fit_aspect_rect(rect.width(), rect.height(), center.x(), center.y(), ratio)
+        return QRect(rect) if fitted is None else QRect(*fitted)
 
     def apply_crop(self) -> None:
         """
@@ -456,56 +589,77 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
             - update_main_display
         """
         crop_rect = self.viewer.get_crop_rect() if self.viewer else self.crop_rect
-        if not crop_rect or not any(img is not None for img in self.processed):
-            return
-
-        crop_rect = self.viewer.get_crop_rect()
-        saved_rect = QRect(crop_rect) if crop_rect is not None else None
-        if saved_rect is None:
+        if not crop_rect or not self.processed_mask:
             return
 
-        # Make sure rectangle is valid and within bounds
-        for i in range(3):
-            if self.processed[i] is not None:
-                img = self.processed[i]
-                if img is not None:  # Double-check to satisfy type checker
-                    img_height, img_width = img.shape[:2]
-                    valid_rect = QRect(0, 0, img_width, img_height).intersected(saved_rect)
-                    saved_rect = valid_rect
-                    break
+        # Make sure rectangle is valid and within bounds; all channels share the canvas shape, and
+        # intersected() already returns a new rectangle
+        if self.canvas_shape is not None:
+            img_height, img_width = self.canvas_shape
+            saved_rect = QRect(0, 0, img_width, img_height).intersected(crop_rect)
+        else:
+            saved_rect = QRect(crop_rect)
 
         if not saved_rect.isValid() or saved_rect.width() <= 0 or saved_rect.height() <= 0:
             return
 
-        # Apply crop to the image in the viewer's scene (visual only)
+        # The image on screen can only stand for the cropped view when it is the current full view, not a
+        # draft or a frame that is outdated or still being composed
+        shown_current = not self.display_composer.busy and self.display_key == current_view_key(self)
+
+        # Apply crop to the image in the viewer's scene (visual only); what is on screen is now a cut of
+        # the previous image
         self.viewer.confirm_crop()
+        self.display_key = None
 
         # Store the crop rectangle for on-the-fly cropping during display
         # Don't modify the underlying images - this is the key change!
         self.viewer.set_saved_crop_rect(saved_rect)
 
-        # Update all channel previews
-        for i in range(3):
-            update_channel_preview(self, i)
-
         # Reset crop mode and UI
         self.crop_mode = False
-        self.crop_mode_btn.setVisible(True)
-        self.crop_controls_widget.setVisible(False)
+        self.crop_stack.setCurrentWidget(self.crop_mode_btn)
         self.viewer.set_crop_mode(False)
 
-        # Update save button state after crop
-        self.update_save_button_state()
+        # confirm_crop already put the cropped view on screen; the channel previews (now out of crop mode,
+        # so they show the crop) follow once control is back in the event loop, once for successive crops
+        if not self.crop_previews_pending:
+            self.crop_previews_pending = True
+            QTimer.singleShot(0, self._refresh_crop_previews)
 
-        # Update mode indicator and status message
-        self._update_mode_from_state()
+        # Update save button state and mode indicator after crop
+        self.update_save_button_state()
         self.status_handler.set_message("Crop applied successfully", self.status_handler.MEDIUM_TIMEOUT)
 
-        # Force a full display update
-        if self.show_combined:
-            show_combined_image(self)
+        # confirm_crop already put the cropped part of the displayed image on screen, so the channels
+        # only need to be recomposed when that did not happen or the displayed image was not current
+        photo = self.viewer.photo
+        if (
+            shown_current
+            and photo is not None
+            and not photo.pixmap().isNull()
+            and photo.pixmap().size() == saved_rect.size()
+        ):
+            self.display_key = current_view_key(self)
         else:
-            show_single_channel_image(self)
+            update_main_display(self)
+
+    def _refresh_crop_previews(self) -> None:
+        """
+        Update the channel previews after a crop was applied.
+
+        Args:
+            self (MainWindow): The instance of the main window.
+
+        Returns:
+            None
+
+        Cross-references:
+            - apply_crop
+            - handlers.channels.update_channel_previews
+        """
+        self.crop_previews_pending = False
+        update_channel_previews(self)
 
     def save_images(self) -> None:
         """
@@ -551,9 +705,25 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         # Clear all image data
         self.original_images = [None, None, None]
         self.aligned = [None, None, None]
+        self.aligned_stack = None
+        self.aligned_pyramid = [[], [], []]
+        self.draft_buffers = [None, None]
         self.processed = [None, None, None]
+        self.processed_mask = 0
+        self.processed_stack = None
+        self.pending_loads = [None, None, None]
         self.original_rgb_images = [None, None, None]
         self.aligned_rgb = [None, None, None]
+        self.adjust_cache = [None, None, None]
+        self.adjust_results.clear()
+        self.composite_cache.clear()
+        self.display_buffers = [None, None]
+        self.display_contents = [None, None]
+        self.display_shown = None
+        self.display_key = None
+        # A frame still being composed belongs to the cleared images
+        if self.display_composer.busy:
+            self.display_composer.stale = True
 
         # Reset display state to defaults
         self.show_combined = DefaultState.SHOW_COMBINED
@@ -562,30 +732,20 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         # Reset crop state - exit crop mode if active
         if self.crop_mode:
             self.crop_mode = False
-            self.crop_mode_btn.setVisible(True)
-            self.crop_controls_widget.setVisible(False)
+            self.crop_stack.setCurrentWidget(self.crop_mode_btn)
             self.viewer.set_crop_mode(False)
 
         # Clear crop geometry
         self.crop_rect = None
         self.crop_ratio = None
+        self.canvas_shape = None
 
         # Clear saved crop from viewer
         if self.viewer:
             self.viewer.set_saved_crop_rect(None)
             self.viewer.set_crop_rect(None)
 
-        # Reset crop ratio combo box to "Free"
-        self.crop_ratio_combo.setCurrentIndex(0)
-
-        # Reset all channel controllers
-        for controller in self.controllers:
-            controller.reset_all_sliders()
-            controller.clear_image()
-
-        # Clear the main viewer
-        if self.viewer:
-            self.viewer.clear_image()
+        self._reset_widgets()
 
         # Update UI state (manages save and crop button states, and mode indicator)
         self.update_save_button_state()
@@ -593,6 +753,44 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         # Show status message
         self.status_handler.set_message("Application reset to default state", self.status_handler.MEDIUM_TIMEOUT)
 
+    def _reset_widgets(self) -> None:
+        """
+        Reset the crop ratio combo, the channel controllers and the viewer to their empty state.
+
+        Args:
+            self (MainWindow): The instance of the main window.
+
+        Returns:
+            None
+        """
+        # Reset the widgets with repaints suspended so the window is repainted once. Their change signals are
+        # blocked, as there is nothing left to crop or adjust, and adjustments already scheduled are dropped.
+        central_widget = self.centralWidget()
+        if central_widget is not None:
+            central_widget.setUpdatesEnabled(False)
+        try:
+            # Reset crop ratio combo box to "Free"
+            if self.crop_ratio_combo is not None:
+                with QSignalBlocker(self.crop_ratio_combo):
+                    self.crop_ratio_combo.setCurrentIndex(0)
+
+            # Reset all channel controllers
+            for controller in self.controllers:
+                with QSignalBlocker(controller):
+                    controller.reset_all_sliders()
+                controller.clear_image()
+            for timer in self.adjust_timers:
+                timer.stop()
+            self.adjust_pending = [False] * len(self.controllers)
+            self.display_timer.stop()
+
+            # Clear the main viewer
+            if self.viewer:
+                self.viewer.clear_image()
+        finally:
+            if central_widget is not None:
+                central_widget.setUpdatesEnabled(True)
+
     def open_grid_settings(self) -> None:
         """
         Open the grid settings dialog as an overlay.
@@ -714,17 +912,50 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
         Returns:
             None
         """
-        # Enable save button if at least one channel image is available
-        has_images = any(img is not None for img in self.aligned)
+        # Enable save button once the channels are aligned (all three at once, into aligned_stack)
+        has_images = self.aligned_stack is not None
         self.save_btn.setEnabled(has_images)
 
         # Enable crop button if at least one processed image is available
-        has_processed = any(img is not None for img in self.processed)
-        self.crop_mode_btn.setEnabled(has_processed)
+        self.crop_mode_btn.setEnabled(self.processed_mask != 0)
 
         # Update mode indicator based on loaded channels
         self._update_mode_from_state()
 
+    def closeEvent(self, event: Union[QCloseEvent, None]) -> None:  # pylint: disable=C0103
+        """
+        Stop the pipeline worker thread and wait for RAW decoding, alignment and display jobs before the window closes.
+
+        Args:
+            event (QCloseEvent | None): The close event.
+
+        Returns:
+            None
+        """
+        self.pipeline_thread.quit()
+        self.pipeline_thread.wait()
+        self.raw_loader.pool.waitForDone()
+        self.image_aligner.pool.waitForDone()
+        self.display_composer.pool.waitForDone()
+        super().closeEvent(event)
+
+    def _on_preview_clicked(self, index: int) -> None:
+        """
+        Show a single channel when its preview label is clicked.
+
+        Args:
+            self (MainWindow): The instance of the main window.
+            index (int): Index of the clicked channel (0=R, 1=G, 2=B).
+
+        Returns:
+            None
+
+        Cross-references:
+            - handlers.channels.show_single_channel
+        """
+        self.status_handler.set_message(CHANNEL_VIEW_MESSAGES[index], self.status_handler.MEDIUM_TIMEOUT)
+        show_single_channel(self, index)
+
     def keyPressEvent(self, event: QKeyEvent) -> None:  # pylint: disable=C0103
         """
         Handle key press events for channel switching and display mode.
@@ -744,16 +975,9 @@ class MainWindow(QMainWindow):  # pylint: disable=too-many-instance-attributes
             - cancel_crop
             - apply_crop
         """
-        if self.crop_mode:
-            if event.key() == Qt.Key.Key_Escape:
-                self.cancel_crop()
-            elif event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
-                self.apply_crop()
-            # Do not allow toggling crop mode with 'C' while in crop mode
-            else:
-                super().keyPressEvent(event)
-        else:
-            if event.key() == Qt.Key.Key_C:
-                self.toggle_crop_mode()
-            elif not handle_key_press(self, event):
-                super().keyPressEvent(event)
+        # 'C' is not in the crop mode table, so crop mode cannot be toggled while cropping
+        action = (self.crop_key_actions if self.crop_mode else self.key_actions).get(event.key())
+        if action is not None:
+            action()
+        elif self.crop_mode or not handle_key_press(self, event):
+            super().keyPressEvent(event)
@@ -23,12 +23,12 @@ Provides sliders for brightness, contrast, and intensity adjustments,
 along with numeric input fields and channel preview.
 """
 
+from functools import partial
 from typing import Union
 
-import cv2
 import numpy as np
 from PyQt5.QtCore import QRect, Qt, pyqtSignal
-from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtGui import QColor, QMouseEvent, QPixmap
 from PyQt5.QtWidgets import (
     QGridLayout,
     QGroupBox,
@@ -41,12 +41,37 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from ..core.image_processing import convert_to_qimage
 from ..default_state import DefaultState
 
 # Import the ResetSlider class
 from .sliders import ResetSlider
 
 
+class ChannelPreviewLabel(QLabel):  # pylint: disable=too-few-public-methods
+    """
+    QLabel subclass for the channel preview that reports clicks.
+
+    Cross-references:
+        - ChannelController: Used for the preview of the processed channel.
+    """
+
+    clicked = pyqtSignal()
+    """
+    Signal emitted when the preview is clicked.
+    """
+
+    def mousePressEvent(self, event: Union[QMouseEvent, None]) -> None:  # pylint: disable=C0103
+        """
+        Handles the mouse press event.
+        Emits the clicked signal and then calls the base class implementation.
+        Args:
+            event (QMouseEvent | None): The mouse press event.
+        """
+        self.clicked.emit()
+        super().mousePressEvent(event)
+
+
 class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attributes
     """
     Widget for controlling a single RGB channel.
@@ -59,10 +84,13 @@ class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attribu
 
     Emits:
     - value_changed: Signal when any adjustment value changes
+    - slider_released: Signal when a slider drag ends
     """
 
     # Custom signal to notify when any adjustment value changes
     value_changed = pyqtSignal()
+    # Custom signal to notify when the user lets go of a slider
+    slider_released = pyqtSignal()
 
     def __init__(self, channel_name: str, color: Qt.GlobalColor, parent: Union[QWidget, None] = None) -> None:
         """
@@ -80,11 +108,15 @@ class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attribu
         self.channel_name = channel_name
         self.color = color
         self.processed_image = None
+        # Image, revision and crop rectangle the preview label currently shows, so unchanged previews are not rebuilt
+        self._preview_source: Union[tuple[np.ndarray, int, Union[tuple, None]], None] = None
+        # Downsampled preview pixels, reused while the preview size stays the same (the pixmap copies them)
+        self._preview_buffer: Union[np.ndarray, None] = None
 
         # Set up the UI components
         self._init_ui()
 
-    def _init_ui(self) -> None:
+    def _init_ui(self) -> None:  # pylint: disable=too-many-statements
         """Set up the controller UI layout with widgets."""
         main_layout = QVBoxLayout(self)
 
@@ -100,7 +132,7 @@ class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attribu
         preview_section.addWidget(self.btn_load)
 
         # Preview area for the processed image
-        self.preview_label = QLabel()
+        self.preview_label = ChannelPreviewLabel()
         self.preview_label.setFixedSize(160, 120)
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preview_label.setStyleSheet("border: 1px solid gray;")
@@ -161,17 +193,15 @@ class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attribu
             adjustments_layout.addWidget(text_input, row, 2)
 
             # Connect slider to text input and value_changed signal
-            slider.valueChanged.connect(
-                lambda value, input_field=text_input: self._update_text_from_slider(value, input_field)
-            )
+            slider.valueChanged.connect(partial(self._update_text_from_slider, text_input=text_input))
 
             # Connect text input to slider
-            text_input.editingFinished.connect(
-                lambda slider=slider, input_field=text_input: self._update_slider_from_text(slider, input_field)
-            )
+            text_input.editingFinished.connect(partial(self._update_slider_from_text, slider, text_input))
+
+            slider.sliderReleased.connect(self.slider_released.emit)
 
             # Connect double-click reset functionality
-            slider.doubleClicked.connect(lambda name=name: self._reset_slider_to_default(name))
+            slider.doubleClicked.connect(partial(self._reset_slider_to_default, name))
 
             row += 1
 
@@ -184,6 +214,15 @@ class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attribu
         # Set a fixed width for the controller
         self.setFixedWidth(240)
 
+    def is_dragging(self) -> bool:
+        """
+        Check whether one of the sliders is currently held down by the user.
+
+        Returns:
+            bool: True while a slider drag is in progress
+        """
+        return any(slider.isSliderDown() for slider in self.sliders.values())
+
     def _update_text_from_slider(self, value: int, text_input: QLineEdit) -> None:
         """
         Update text input field when slider value changes.
@@ -274,44 +313,58 @@ class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attribu
 
     def _create_placeholder_preview(self) -> None:
         """Create an empty placeholder preview."""
-        placeholder = np.zeros((120, 160), dtype=np.uint8)
+        placeholder = QPixmap(160, 120)
         # Add a light gray value to make it visible
-        placeholder.fill(30)
-        self._set_preview(placeholder)
+        placeholder.fill(QColor(30, 30, 30))
+        self.preview_label.setPixmap(placeholder)
+        self._preview_source = None
 
-    def update_preview(self) -> None:
-        """Update the preview label with the current processed image."""
+    def update_preview(self, revision: int = 0, crop_rect: Union[QRect, None] = None) -> None:
+        """
+        Update the preview label with the current processed image.
+
+        Args:
+            revision (int): Version of the processed image's pixels; it must change when they are modified
+                in place, otherwise an unchanged image and crop keep the current preview.
+            crop_rect (QRect | None): Part of the image to preview, or None for the whole image.
+        """
         if self.processed_image is not None:
-            self._set_preview(self.processed_image)
+            self._set_preview(self.processed_image, revision, crop_rect)
         else:
             self._create_placeholder_preview()
 
-    def _set_preview(self, img: np.ndarray) -> None:
+    def _set_preview(  # pylint: disable=too-many-locals
+        self, img: np.ndarray, revision: int, crop_rect: Union[QRect, None]
+    ) -> None:
         """
         Set the preview image in the label.
 
         Args:
             img (np.ndarray): Grayscale image to display
+            revision (int): Version of the image's pixels
+            crop_rect (QRect | None): Part of the image to preview, or None for the whole image
         """
-        # Create a copy of the image to avoid potential reference issues
-        preview_img = img.copy()
-
-        # Get dimensions from parent if possible to handle cropping
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, "viewer") and hasattr(parent.viewer, "get_saved_crop_rect"):
-                saved_crop_rect = parent.viewer.get_saved_crop_rect()
-                if saved_crop_rect and not getattr(parent, "crop_mode", False):
-                    # Apply crop on-the-fly for previews too
-                    h, w = preview_img.shape[:2]
-
-                    valid_rect = QRect(0, 0, w, h).intersected(saved_crop_rect)
-                    if valid_rect.isValid() and valid_rect.width() > 0 and valid_rect.height() > 0:
-                        preview_img = preview_img[
-                            valid_rect.top() : valid_rect.bottom() + 1, valid_rect.left() : valid_rect.right() + 1
-                        ].copy()
-                break
-            parent = parent.parent()
+        # Work on views of the processed image; nothing here modifies the pixels
+        preview_img = img
+        crop_key = None
+
+        if crop_rect is not None:
+            # Apply crop on-the-fly for previews too
+            h, w = preview_img.shape[:2]
+            valid_rect = QRect(0, 0, w, h).intersected(crop_rect)
+            if valid_rect.isValid() and valid_rect.width() > 0 and valid_rect.height() > 0:
+                preview_img = preview_img[
+                    valid_rect.top() : valid_rect.bottom() + 1, valid_rect.left() : valid_rect.right() + 1
+                ]
+                crop_key = valid_rect.getRect()
+
+        # The label already shows this image with this crop (e.g. a crop applied again unchanged)
+        source = self._preview_source
+        if source is not None and source[0] is img and source[1:] == (revision, crop_key):
+            return
+
+        # OpenCV is imported lazily so it does not weigh on application startup
+        import cv2  # pylint: disable=import-outside-toplevel
 
         # Resize while preserving aspect ratio
         h, w = preview_img.shape[:2]
@@ -324,9 +377,16 @@ class ChannelController(QGroupBox):  # pylint: disable=too-many-instance-attribu
             new_h = 120
             new_w = int(new_h * aspect)
 
-        preview = cv2.resize(preview_img, (new_w, new_h), interpolation=cv2.INTER_AREA)  # pylint: disable=E1101
+        # Subsample large images first so the area filter only reads about twice the preview resolution
+        stride = max(1, min(w // (2 * new_w), h // (2 * new_h)))
+        if stride > 1:
+            preview_img = preview_img[::stride, ::stride]
+
+        preview = self._preview_buffer
+        if preview is None or preview.shape != (new_h, new_w):
+            preview = self._preview_buffer = np.empty((new_h, new_w), dtype=np.uint8)
+        cv2.resize(preview_img, (new_w, new_h), dst=preview, interpolation=cv2.INTER_AREA)  # pylint: disable=E1101
 
         # Convert to QPixmap and set in label
-        q_img = QImage(preview.data, preview.shape[1], preview.shape[0], preview.strides[0], QImage.Format_Grayscale8)
-        pixmap = QPixmap.fromImage(q_img)
-        self.preview_label.setPixmap(pixmap)
+        self.preview_label.setPixmap(QPixmap.fromImage(convert_to_qimage(preview)))
+        self._preview_source = (img, revision, crop_key)
@@ -178,8 +178,11 @@ class CropHandler:  # pylint: disable=too-many-public-methods
         self.view.viewport().update()
 
     def set_crop_ratio(self, ratio: Union[tuple[int, int], None], photo: Union[QGraphicsPixmapItem, None]) -> None:
-        """Set the aspect ratio for the crop rectangle."""
-        if ratio is None or not isinstance(ratio, tuple) or len(ratio) != 2:
+        """Set the aspect ratio for the crop rectangle, or None for a free crop."""
+        if ratio is None:
+            self._crop_ratio = None
+            return
+        if not isinstance(ratio, tuple) or len(ratio) != 2:
             return
 
         # Update the ratio
@@ -20,15 +20,20 @@ Custom QGraphicsView widget for displaying and interacting with images,
 including zoom, fit-to-view, and drag-to-pan functionality.
 """
 
+import os
 from typing import Union
 
 from PyQt5.QtCore import QEvent, QRect, QRectF, Qt
-from PyQt5.QtGui import QMouseEvent, QPainter, QPixmap, QResizeEvent, QWheelEvent
-from PyQt5.QtWidgets import QGraphicsPixmapItem, QGraphicsScene, QGraphicsView, QWidget
+from PyQt5.QtGui import QMouseEvent, QOpenGLContext, QPainter, QPixmap, QResizeEvent, QWheelEvent
+from PyQt5.QtWidgets import QGraphicsPixmapItem, QGraphicsScene, QGraphicsView, QOpenGLWidget, QWidget
 
 from src.widgets.crop_handler import CropHandler
 from src.widgets.grid_overlay import GridOverlay
 
+# Environment variable that, when set to 1, renders the viewer through an OpenGL viewport. Off by default:
+# some drivers cannot upload textures the size of a full-resolution frame
+OPENGL_VIEWPORT_ENV = "PROKUDIN_OPENGL"
+
 
 class ImageViewer(QGraphicsView):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
@@ -65,6 +70,7 @@ class ImageViewer(QGraphicsView):  # pylint: disable=too-many-instance-attribute
         self._scene = QGraphicsScene(self)
         self.photo: Union[QGraphicsPixmapItem, None] = self._scene.addPixmap(QPixmap())
         self.setScene(self._scene)
+        self._use_opengl_viewport()
         self.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -79,6 +85,26 @@ class ImageViewer(QGraphicsView):  # pylint: disable=too-many-instance-attribute
         # Initialize crop handler with shared grid overlay
         self._crop_handler = CropHandler(self, self._grid_overlay)
 
+    def _use_opengl_viewport(self) -> None:
+        """
+        Renders the scene through an OpenGL viewport when enabled through OPENGL_VIEWPORT_ENV and an
+        OpenGL context is available.
+
+        Each new pixmap is then uploaded as a texture and scaled by the GPU on repaints (zoom, pan, crop
+        overlay drags) instead of being resampled on the CPU. Otherwise the default raster viewport is kept.
+
+        Args:
+            self (ImageViewer): The instance of the image viewer.
+
+        Returns:
+            None
+        """
+        if os.environ.get(OPENGL_VIEWPORT_ENV) != "1" or not QOpenGLContext().create():
+            return
+        self.setViewport(QOpenGLWidget())
+        # Partial updates bring no benefit with OpenGL, where the whole frame is redrawn anyway
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+
     @property
     def grid_overlay(self) -> GridOverlay:
         """